@@ -25,6 +25,10 @@ from app.models.wishlist import Wishlist  # noqa: F401, E402
 from app.models.item import WishlistItem  # noqa: F401, E402
 from app.models.reservation import ItemReservation  # noqa: F401, E402
 from app.models.contribution import ItemContribution  # noqa: F401, E402
+from app.models.revoked_token import RevokedToken  # noqa: F401, E402
+from app.models.parsed_url import ParsedUrl  # noqa: F401, E402
+from app.models.wb_basket import WbBasket  # noqa: F401, E402
+from app.models.mirrored_image import MirroredImage  # noqa: F401, E402
 from app.core.database import Base  # noqa: E402
 
 target_metadata = Base.metadata
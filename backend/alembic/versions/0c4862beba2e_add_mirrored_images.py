@@ -0,0 +1,36 @@
+"""add mirrored images
+
+Revision ID: 0c4862beba2e
+Revises: 26015e2abe6f
+Create Date: 2026-10-18 23:20:04.259143
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c4862beba2e'
+down_revision: Union[str, None] = '26015e2abe6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('mirrored_images',
+    sa.Column('source_hash', sa.String(length=64), nullable=False),
+    sa.Column('source_url', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.String(length=200), nullable=True),
+    sa.Column('retry_after', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('source_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('mirrored_images')
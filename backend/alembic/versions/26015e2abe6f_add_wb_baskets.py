@@ -0,0 +1,31 @@
+"""add wb baskets
+
+Revision ID: 26015e2abe6f
+Revises: 5e0b93c7a1f4
+Create Date: 2026-10-18 23:11:34.402704
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '26015e2abe6f'
+down_revision: Union[str, None] = '5e0b93c7a1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('wb_baskets',
+    sa.Column('vol', sa.Integer(), nullable=False),
+    sa.Column('basket', sa.SmallInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('vol')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('wb_baskets')
@@ -0,0 +1,28 @@
+"""add guest email indexes
+
+Revision ID: 4b7e2c91d0a5
+Revises: 9dd8a1dca3e1
+Create Date: 2026-10-18 10:12:41.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c91d0a5'
+down_revision: Union[str, None] = '9dd8a1dca3e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_item_reservations_guest_email_item', 'item_reservations', ['guest_email', 'item_id'], unique=False, postgresql_where=sa.text('guest_email IS NOT NULL'))
+    op.create_index('ix_item_contributions_guest_email_item', 'item_contributions', ['guest_email', 'item_id'], unique=False, postgresql_where=sa.text('guest_email IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_item_contributions_guest_email_item', table_name='item_contributions')
+    op.drop_index('ix_item_reservations_guest_email_item', table_name='item_reservations')
@@ -0,0 +1,36 @@
+"""add parsed urls
+
+Revision ID: 5e0b93c7a1f4
+Revises: d81a4f6c2e90
+Create Date: 2026-10-18 19:26:53.114902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0b93c7a1f4'
+down_revision: Union[str, None] = 'd81a4f6c2e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('parsed_urls',
+    sa.Column('url_hash', sa.String(length=64), nullable=False),
+    sa.Column('url', sa.Text(), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('url_hash')
+    )
+    op.create_index(op.f('ix_parsed_urls_expires_at'), 'parsed_urls', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_parsed_urls_expires_at'), table_name='parsed_urls')
+    op.drop_table('parsed_urls')
@@ -0,0 +1,25 @@
+"""add wishlist slug pattern index
+
+Revision ID: c3f19a2e7b64
+Revises: 4b7e2c91d0a5
+Create Date: 2026-10-18 14:05:27.640318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f19a2e7b64'
+down_revision: Union[str, None] = '4b7e2c91d0a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_wishlists_slug_pattern', 'wishlists', ['slug'], unique=False, postgresql_ops={'slug': 'varchar_pattern_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_wishlists_slug_pattern', table_name='wishlists')
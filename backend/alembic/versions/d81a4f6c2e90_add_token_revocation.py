@@ -0,0 +1,39 @@
+"""add token revocation
+
+Revision ID: d81a4f6c2e90
+Revises: c3f19a2e7b64
+Create Date: 2026-10-18 17:42:11.208415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81a4f6c2e90'
+down_revision: Union[str, None] = 'c3f19a2e7b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.create_table('revoked_tokens',
+    sa.Column('jti', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    op.create_index(op.f('ix_revoked_tokens_created_at'), 'revoked_tokens', ['created_at'], unique=False)
+    op.create_index(op.f('ix_revoked_tokens_user_id'), 'revoked_tokens', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_revoked_tokens_user_id'), table_name='revoked_tokens')
+    op.drop_index(op.f('ix_revoked_tokens_created_at'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
+    op.drop_column('users', 'token_version')
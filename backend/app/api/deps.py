@@ -2,13 +2,17 @@ from collections.abc import AsyncGenerator
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import async_session
+from app.core.constants import READ_PRIMARY_HEADER
+from app.core.database import async_session, async_session_read, async_session_read_primary
+from app.core.principal_cache import cache_principal, principal_cache
+from app.core.revocation import revocations
 from app.core.security import decode_access_token
+from app.core.wishlist_cache import WishlistMeta, wishlist_cache
 from app.models.item import WishlistItem
 from app.models.user import User
 from app.models.wishlist import Wishlist
@@ -22,53 +26,81 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
 
 
-async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
-    """Session without an explicit write transaction (autobegin)."""
-    async with async_session() as session:
+async def get_db_readonly(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only transaction, on the replica unless the client asks for the primary."""
+    if request.headers.get(READ_PRIMARY_HEADER):
+        session_factory = async_session_read_primary
+    else:
+        session_factory = async_session_read
+    async with session_factory() as session:
         yield session
 
 
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
+
+
+async def _authenticate(db: AsyncSession, token: str) -> User:
+    """Resolve the user behind an access token or raise 401.
+
+    Cached principals and revocation checks are in-memory, so the common path
+    runs no query; token_version is compared against the row loaded on a miss.
+    """
+    cached = principal_cache.get(token)
+    if cached is not None:
+        if revocations.is_revoked(cached.jti):
+            principal_cache.pop(token)
+            raise _unauthorized("Token has been revoked")
+        return cached.user
+    payload = decode_access_token(token)
+    if not payload:
+        raise _unauthorized("Invalid or expired token")
+    if revocations.is_revoked(payload.get("jti")):
+        raise _unauthorized("Token has been revoked")
+    try:
+        user_id = UUID(payload["sub"])
+    except (ValueError, KeyError):
+        raise _unauthorized("Invalid or expired token")
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    if not user:
+        raise _unauthorized("User not found")
+    if payload.get("ver", 0) != user.token_version:
+        raise _unauthorized("Token has been revoked")
+    cache_principal(token, payload, user)
+    return user
+
+
 async def _resolve_optional_user(
     db: AsyncSession, token: Optional[str]
 ) -> Optional[User]:
     """Shared logic for resolving a user from a JWT token."""
     if not token:
         return None
-    payload = decode_access_token(token)
-    if not payload:
-        return None
     try:
-        user_id = UUID(payload["sub"])
-    except (ValueError, KeyError):
+        return await _authenticate(db, token)
+    except HTTPException:
         return None
-    result = await db.execute(select(User).where(User.id == user_id))
-    return result.scalar_one_or_none()
+
+
+async def _require_user(db: AsyncSession, token: Optional[str]) -> User:
+    if not token:
+        raise _unauthorized("Not authenticated")
+    return await _authenticate(db, token)
 
 
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
     token: Optional[str] = Depends(oauth2_scheme),
 ) -> User:
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-        )
-    payload = decode_access_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
-    user_id = UUID(payload["sub"])
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-    return user
+    return await _require_user(db, token)
+
+
+async def get_current_user_readonly(
+    db: AsyncSession = Depends(get_db_readonly),
+    token: Optional[str] = Depends(oauth2_scheme),
+) -> User:
+    return await _require_user(db, token)
 
 
 async def get_current_user_optional(
@@ -85,8 +117,21 @@ async def get_current_user_optional_readonly(
     return await _resolve_optional_user(db, token)
 
 
-async def get_wishlist_slug(item: WishlistItem, db: AsyncSession) -> str:
+async def get_wishlist_meta(wishlist_id: UUID, db: AsyncSession) -> WishlistMeta:
+    """Slug, owner and flags of a wishlist, served from the process-local cache."""
+    meta = wishlist_cache.get(wishlist_id)
+    if meta is not None:
+        return meta
     result = await db.execute(
-        select(Wishlist.slug).where(Wishlist.id == item.wishlist_id)
+        select(
+            Wishlist.slug, Wishlist.user_id, Wishlist.is_archived, Wishlist.is_deleted
+        ).where(Wishlist.id == wishlist_id)
     )
-    return result.scalar_one()
+    meta = WishlistMeta(*result.one())
+    wishlist_cache.set(wishlist_id, meta)
+    return meta
+
+
+async def get_wishlist_slug(item: WishlistItem, db: AsyncSession) -> str:
+    meta = await get_wishlist_meta(item.wishlist_id, db)
+    return meta.slug
@@ -1,14 +1,21 @@
 import logging
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_current_user_readonly, get_db, oauth2_scheme
 from app.core.config import settings
+from app.core.database import after_commit
+from app.core.google_jwks import google_keys
 from app.core.limiter import limiter
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.principal_cache import invalidate_user, principal_cache
+from app.core.revocation import revocations
+from app.core.security import create_access_token, decode_access_token, hash_password, verify_password
+from app.models.revoked_token import RevokedToken
 from app.models.user import User
 from app.schemas.auth import (
     GoogleMobileAuthRequest,
@@ -64,13 +71,13 @@ async def register(request: Request, data: RegisterRequest, db: AsyncSession = D
 
     user = User(
         email=email,
-        password_hash=hash_password(data.password),
+        password_hash=await hash_password(data.password),
         name=data.name.strip(),
     )
     db.add(user)
     await db.flush()
 
-    token = create_access_token(user.id)
+    token = create_access_token(user.id, user.token_version)
     logger.info("User registered: %s", email)
     return TokenResponse(access_token=token)
 
@@ -89,19 +96,19 @@ async def login(request: Request, data: LoginRequest, db: AsyncSession = Depends
             detail="Неверный email или пароль",
         )
 
-    if not verify_password(data.password, user.password_hash):
+    if not await verify_password(data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неверный email или пароль",
         )
 
-    token = create_access_token(user.id)
+    token = create_access_token(user.id, user.token_version)
     logger.info("User logged in: %s", email)
     return TokenResponse(access_token=token)
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(user: User = Depends(get_current_user)):
+async def get_me(user: User = Depends(get_current_user_readonly)):
     return UserResponse(
         id=str(user.id),
         email=user.email,
@@ -111,6 +118,45 @@ async def get_me(user: User = Depends(get_current_user)):
     )
 
 
+@router.post("/logout")
+async def logout(
+    user: User = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
+    """Revoke the current access token."""
+    payload = decode_access_token(token)
+    jti = payload.get("jti")
+    if jti:
+        expires_at = datetime.fromtimestamp(payload["exp"], timezone.utc).replace(tzinfo=None)
+        await db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, user_id=user.id, expires_at=expires_at)
+            .on_conflict_do_nothing()
+        )
+        revocations.add(jti, expires_at)
+    # Dropped only once committed: a request in between would re-cache it
+    after_commit(db, lambda: principal_cache.pop(token))
+    return {"detail": "Вы вышли из аккаунта"}
+
+
+@router.post("/logout-all")
+async def logout_all(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Revoke every token issued to the user so far."""
+    await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(token_version=User.token_version + 1)
+    )
+    user_id = user.id
+    # A request still seeing the old token_version would re-cache it
+    after_commit(db, lambda: invalidate_user(user_id))
+    return {"detail": "Вы вышли на всех устройствах"}
+
+
 # --- Google OAuth (shared helper + endpoints) ---
 
 
@@ -136,6 +182,8 @@ async def _find_or_create_google_user(
         if avatar_url and not user.avatar_url:
             user.avatar_url = avatar_url
         await db.flush()
+        user_id = user.id
+        after_commit(db, lambda: invalidate_user(user_id))
     else:
         user = User(
             email=email,
@@ -186,7 +234,7 @@ async def google_callback(request: Request, db: AsyncSession = Depends(get_db)):
 
     user = await _find_or_create_google_user(db, email, name, avatar_url, oauth_id)
 
-    jwt_token = create_access_token(user.id)
+    jwt_token = create_access_token(user.id, user.token_version)
     logger.info("OAuth login: %s", email)
     return RedirectResponse(f"{settings.FRONTEND_URL}/callback?token={jwt_token}")
 
@@ -212,16 +260,9 @@ async def google_mobile_auth(
             detail="Google OAuth not configured",
         )
 
-    # Verify the id_token with Google
+    # Verify the id_token locally against Google's cached signing keys
     try:
-        from google.auth.transport import requests as google_requests
-        from google.oauth2 import id_token as google_id_token
-
-        id_info = google_id_token.verify_oauth2_token(
-            data.id_token,
-            google_requests.Request(),
-            settings.GOOGLE_CLIENT_ID,
-        )
+        id_info = await google_keys.verify(data.id_token, settings.GOOGLE_CLIENT_ID)
     except ValueError as exc:
         logger.warning("Invalid Google id_token: %s", exc)
         raise HTTPException(
@@ -243,6 +284,6 @@ async def google_mobile_auth(
 
     user = await _find_or_create_google_user(db, email, name, avatar_url, oauth_id)
 
-    jwt_token = create_access_token(user.id)
+    jwt_token = create_access_token(user.id, user.token_version)
     logger.info("Mobile Google auth: %s", email)
     return TokenResponse(access_token=jwt_token)
@@ -3,6 +3,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db_readonly
+from app.core.circuit_breaker import circuit_stats
+from app.core.security import password_hash_stats
 
 router = APIRouter()
 
@@ -11,3 +13,8 @@ router = APIRouter()
 async def health_check(db: AsyncSession = Depends(get_db_readonly)):
     await db.execute(text("SELECT 1"))
     return {"status": "ok", "db": "connected"}
+
+
+@router.get("/health/metrics")
+async def health_metrics():
+    return {"password_hash": password_hash_stats(), "circuits": circuit_stats()}
@@ -1,28 +1,73 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import Integer, Uuid, column, exists, func, insert, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_current_user, get_db, get_wishlist_slug
-from app.core.constants import DEFAULT_ITEMS_PAGE_SIZE, MAX_ITEMS_PER_WISHLIST
+from app.api.deps import get_current_user, get_current_user_readonly, get_db, get_db_readonly
+from app.core.constants import DEFAULT_ITEMS_PAGE_SIZE, ITEM_POSITION_GAP, MAX_ITEMS_PER_WISHLIST
+from app.core.database import async_session
 from app.core.ws_manager import manager
 from app.models.item import WishlistItem
 from app.models.user import User
 from app.models.wishlist import Wishlist
 from app.models.contribution import ItemContribution
-from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate, ReorderRequest
+from app.models.reservation import ItemReservation
+from app.schemas.item import (
+    ItemBulkAction,
+    ItemBulkCreate,
+    ItemCreate,
+    ItemMove,
+    ItemResponse,
+    ItemUpdate,
+    ReorderRequest,
+)
 from app.schemas.pagination import PaginatedResponse
+from app.utils.image_mirror import schedule_mirror
 from app.utils.pagination import paginate
+from app.utils.tasks import spawn_after_commit
 
 router = APIRouter(tags=["items"])
 
 
-def item_to_response(item: WishlistItem) -> ItemResponse:
-    is_reserved = item.reservation is not None if hasattr(item, "reservation") and item.reservation is not None else False
-    total_contributed = sum(c.amount for c in item.contributions) if hasattr(item, "contributions") else 0
-    contributors_count = len(item.contributions) if hasattr(item, "contributions") else 0
+# Reservation/contribution aggregates of an item, computed in the same
+# statement as the mutation (RETURNING) instead of reloading relationships.
+ITEM_STATE_COLUMNS = (
+    exists()
+    .where(ItemReservation.item_id == WishlistItem.id)
+    .correlate(WishlistItem)
+    .label("is_reserved"),
+    select(func.coalesce(func.sum(ItemContribution.amount), 0))
+    .where(ItemContribution.item_id == WishlistItem.id)
+    .correlate(WishlistItem)
+    .scalar_subquery()
+    .label("total_contributed"),
+    select(func.count(ItemContribution.id))
+    .where(ItemContribution.item_id == WishlistItem.id)
+    .correlate(WishlistItem)
+    .scalar_subquery()
+    .label("contributors_count"),
+)
+
+
+def item_to_response(
+    item: WishlistItem,
+    is_reserved: bool | None = None,
+    total_contributed: int | None = None,
+    contributors_count: int | None = None,
+) -> ItemResponse:
+    """Build an owner-facing item response.
+
+    Aggregates default to the loaded relationships; RETURNING-based
+    mutations pass them in explicitly.
+    """
+    if is_reserved is None:
+        is_reserved = item.reservation is not None
+    if total_contributed is None:
+        total_contributed = sum(c.amount for c in item.contributions)
+    if contributors_count is None:
+        contributors_count = len(item.contributions)
 
     return ItemResponse(
         id=str(item.id),
@@ -41,6 +86,31 @@ def item_to_response(item: WishlistItem) -> ItemResponse:
     )
 
 
+def owned_item_criteria(item_id: UUID, user: User, is_deleted: bool) -> tuple:
+    """WHERE criteria matching an item of a wishlist owned by the user (UPDATE ... FROM wishlists)."""
+    return (
+        WishlistItem.id == item_id,
+        WishlistItem.wishlist_id == Wishlist.id,
+        Wishlist.user_id == user.id,
+        WishlistItem.is_deleted == is_deleted,
+    )
+
+
+def positions_values(positions: list[tuple[UUID, int]]):
+    """VALUES list of (id, position) to join against in a single UPDATE ... FROM."""
+    return values(
+        column("id", Uuid), column("position", Integer), name="new_positions"
+    ).data(positions)
+
+
+def group_ids_by_slug(rows) -> dict[str, list[str]]:
+    """Group (item_id, slug) rows so each wishlist gets one coalesced event."""
+    grouped: dict[str, list[str]] = {}
+    for item_id, slug in rows:
+        grouped.setdefault(slug, []).append(str(item_id))
+    return grouped
+
+
 async def get_owner_wishlist(wishlist_id: UUID, user: User, db: AsyncSession) -> Wishlist:
     result = await db.execute(
         select(Wishlist).where(
@@ -55,13 +125,37 @@ async def get_owner_wishlist(wishlist_id: UUID, user: User, db: AsyncSession) ->
     return wishlist
 
 
+async def get_owner_wishlist_state(
+    wishlist_id: UUID, user: User, db: AsyncSession
+) -> tuple[str, int, int]:
+    """Return (slug, active items count, max position) of an owned wishlist in one query."""
+    result = await db.execute(
+        select(
+            Wishlist.slug,
+            func.count(WishlistItem.id).filter(WishlistItem.is_deleted == False),
+            func.coalesce(func.max(WishlistItem.position), 0),
+        )
+        .outerjoin(WishlistItem, WishlistItem.wishlist_id == Wishlist.id)
+        .where(
+            Wishlist.id == wishlist_id,
+            Wishlist.user_id == user.id,
+            Wishlist.is_deleted == False,
+        )
+        .group_by(Wishlist.id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Вишлист не найден")
+    return row[0], row[1], row[2]
+
+
 @router.get("/wishlists/{wishlist_id}/items", response_model=PaginatedResponse[ItemResponse])
 async def list_items(
     wishlist_id: UUID,
     page: int = Query(1, ge=1),
     per_page: int = Query(DEFAULT_ITEMS_PAGE_SIZE, ge=1, le=100),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     await get_owner_wishlist(wishlist_id, user, db)
 
@@ -79,6 +173,18 @@ async def list_items(
     return result
 
 
+def item_create_values(wishlist_id: UUID, data: ItemCreate, position: int) -> dict:
+    return {
+        "wishlist_id": wishlist_id,
+        "title": data.title.strip(),
+        "url": data.url,
+        "price": data.price,
+        "image_url": data.image_url,
+        "note": data.note.strip() if data.note else None,
+        "position": position,
+    }
+
+
 @router.post("/wishlists/{wishlist_id}/items", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
 async def create_item(
     wishlist_id: UUID,
@@ -86,55 +192,66 @@ async def create_item(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    wishlist = await get_owner_wishlist(wishlist_id, user, db)
+    slug, count, max_pos = await get_owner_wishlist_state(wishlist_id, user, db)
 
     # Check limit
-    count_result = await db.execute(
-        select(func.count(WishlistItem.id)).where(
-            WishlistItem.wishlist_id == wishlist_id,
-            WishlistItem.is_deleted == False,
-        )
-    )
-    count = count_result.scalar_one()
     if count >= MAX_ITEMS_PER_WISHLIST:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Максимум {MAX_ITEMS_PER_WISHLIST} товаров в вишлисте",
         )
 
-    # Get next position
-    max_pos_result = await db.execute(
-        select(func.max(WishlistItem.position)).where(
-            WishlistItem.wishlist_id == wishlist_id
-        )
-    )
-    max_pos = max_pos_result.scalar_one() or 0
-
-    item = WishlistItem(
-        wishlist_id=wishlist_id,
-        title=data.title.strip(),
-        url=data.url,
-        price=data.price,
-        image_url=data.image_url,
-        note=data.note.strip() if data.note else None,
-        position=max_pos + 1,
+    result = await db.execute(
+        insert(WishlistItem)
+        .values(**item_create_values(wishlist_id, data, max_pos + ITEM_POSITION_GAP))
+        .returning(WishlistItem)
     )
-    db.add(item)
-    await db.flush()
+    item = result.scalar_one()
+    schedule_mirror(db, [(item.id, item.image_url)])
 
-    # Reload with relationships
-    result = await db.execute(
-        select(WishlistItem)
-        .where(WishlistItem.id == item.id)
-        .options(
-            selectinload(WishlistItem.reservation),
-            selectinload(WishlistItem.contributions),
+    await manager.broadcast(slug, {"type": "item_added", "item_id": str(item.id)})
+    # A new item has no reservation or contributions yet
+    return item_to_response(item, is_reserved=False, total_contributed=0, contributors_count=0)
+
+
+@router.post(
+    "/wishlists/{wishlist_id}/items/bulk",
+    response_model=list[ItemResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_items_bulk(
+    wishlist_id: UUID,
+    data: ItemBulkCreate,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create several items at once (e.g. importing a list from another service)."""
+    slug, count, max_pos = await get_owner_wishlist_state(wishlist_id, user, db)
+
+    if count + len(data.items) > MAX_ITEMS_PER_WISHLIST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Максимум {MAX_ITEMS_PER_WISHLIST} товаров в вишлисте",
         )
+
+    rows = [
+        item_create_values(wishlist_id, item_data, max_pos + i * ITEM_POSITION_GAP)
+        for i, item_data in enumerate(data.items, start=1)
+    ]
+    result = await db.execute(
+        insert(WishlistItem).returning(WishlistItem, sort_by_parameter_order=True),
+        rows,
     )
-    item = result.scalar_one()
+    items = list(result.scalars().all())
+    schedule_mirror(db, [(item.id, item.image_url) for item in items])
 
-    await manager.broadcast(wishlist.slug, {"type": "item_added", "item_id": str(item.id)})
-    return item_to_response(item)
+    await manager.broadcast(
+        slug, {"type": "items_added", "item_ids": [str(item.id) for item in items]}
+    )
+    return [
+        item_to_response(item, is_reserved=False, total_contributed=0, contributors_count=0)
+        for item in items
+    ]
 
 
 @router.put("/items/{item_id}", response_model=ItemResponse)
@@ -144,37 +261,38 @@ async def update_item(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(WishlistItem)
-        .join(Wishlist)
-        .where(
-            WishlistItem.id == item_id,
-            Wishlist.user_id == user.id,
-            WishlistItem.is_deleted == False,
-        )
-        .options(
-            selectinload(WishlistItem.reservation),
-            selectinload(WishlistItem.contributions),
-        )
-    )
-    item = result.scalar_one_or_none()
-    if not item:
-        raise HTTPException(status_code=404, detail="Товар не найден")
-
     allowed_fields = {"title", "url", "price", "image_url", "note"}
     update_data = data.model_dump(exclude_unset=True)
+    values = {}
     for field, value in update_data.items():
         if field not in allowed_fields:
             continue
         if field in ("title", "note") and isinstance(value, str):
             value = value.strip()
-        setattr(item, field, value)
+        values[field] = value
+
+    criteria = owned_item_criteria(item_id, user, is_deleted=False)
+    if values:
+        stmt = (
+            update(WishlistItem)
+            .where(*criteria)
+            .values(**values)
+            .returning(WishlistItem, Wishlist.slug, *ITEM_STATE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        # Nothing to change: keep updated_at as is
+        stmt = select(WishlistItem, Wishlist.slug, *ITEM_STATE_COLUMNS).where(*criteria)
 
-    await db.flush()
+    row = (await db.execute(stmt)).one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Товар не найден")
+    item, slug, is_reserved, total_contributed, contributors_count = row
+    if "image_url" in values:
+        schedule_mirror(db, [(item.id, item.image_url)])
 
-    slug = await get_wishlist_slug(item, db)
     await manager.broadcast(slug, {"type": "item_updated", "item_id": str(item.id)})
-    return item_to_response(item)
+    return item_to_response(item, is_reserved, total_contributed, contributors_count)
 
 
 @router.delete("/items/{item_id}", status_code=status.HTTP_200_OK)
@@ -184,23 +302,17 @@ async def delete_item(
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        select(WishlistItem)
-        .join(Wishlist)
-        .where(
-            WishlistItem.id == item_id,
-            Wishlist.user_id == user.id,
-            WishlistItem.is_deleted == False,
-        )
+        update(WishlistItem)
+        .where(*owned_item_criteria(item_id, user, is_deleted=False))
+        .values(is_deleted=True)
+        .returning(Wishlist.slug)
+        .execution_options(synchronize_session=False)
     )
-    item = result.scalar_one_or_none()
-    if not item:
+    slug = result.scalar_one_or_none()
+    if not slug:
         raise HTTPException(status_code=404, detail="Товар не найден")
 
-    item.is_deleted = True
-    await db.flush()
-
-    slug = await get_wishlist_slug(item, db)
-    await manager.broadcast(slug, {"type": "item_deleted", "item_id": str(item.id)})
+    await manager.broadcast(slug, {"type": "item_deleted", "item_id": str(item_id)})
     return {"detail": "Товар удалён"}
 
 
@@ -211,28 +323,228 @@ async def restore_item(
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        select(WishlistItem)
-        .join(Wishlist)
+        update(WishlistItem)
+        .where(*owned_item_criteria(item_id, user, is_deleted=True))
+        .values(is_deleted=False)
+        .returning(WishlistItem, Wishlist.slug, *ITEM_STATE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Товар не найден")
+    item, slug, is_reserved, total_contributed, contributors_count = row
+
+    await manager.broadcast(slug, {"type": "item_added", "item_id": str(item.id)})
+    return item_to_response(item, is_reserved, total_contributed, contributors_count)
+
+
+@router.post("/items/bulk")
+async def bulk_items_action(
+    data: ItemBulkAction,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete, restore or move a set of items with set-based statements."""
+    item_ids = list(dict.fromkeys(data.item_ids))
+    owned = (
+        WishlistItem.id.in_(item_ids),
+        WishlistItem.wishlist_id == Wishlist.id,
+        Wishlist.user_id == user.id,
+    )
+
+    if data.action == "delete":
+        result = await db.execute(
+            update(WishlistItem)
+            .where(*owned, WishlistItem.is_deleted == False)
+            .values(is_deleted=True)
+            .returning(WishlistItem.id, Wishlist.slug)
+            .execution_options(synchronize_session=False)
+        )
+        events = {slug: ("items_deleted", ids) for slug, ids in group_ids_by_slug(result.all()).items()}
+        detail = "Товары удалены"
+
+    elif data.action == "restore":
+        # Per wishlist: how many items would come back vs. how many are active
+        result = await db.execute(
+            select(
+                func.count(WishlistItem.id).filter(
+                    WishlistItem.id.in_(item_ids), WishlistItem.is_deleted == True
+                ),
+                func.count(WishlistItem.id).filter(WishlistItem.is_deleted == False),
+            )
+            .join(Wishlist, WishlistItem.wishlist_id == Wishlist.id)
+            .where(
+                Wishlist.user_id == user.id,
+                WishlistItem.wishlist_id.in_(
+                    select(WishlistItem.wishlist_id).where(WishlistItem.id.in_(item_ids))
+                ),
+            )
+            .group_by(WishlistItem.wishlist_id)
+        )
+        if any(restoring + active > MAX_ITEMS_PER_WISHLIST for restoring, active in result.all()):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Максимум {MAX_ITEMS_PER_WISHLIST} товаров в вишлисте",
+            )
+
+        result = await db.execute(
+            update(WishlistItem)
+            .where(*owned, WishlistItem.is_deleted == True)
+            .values(is_deleted=False)
+            .returning(WishlistItem.id, Wishlist.slug)
+            .execution_options(synchronize_session=False)
+        )
+        events = {slug: ("items_added", ids) for slug, ids in group_ids_by_slug(result.all()).items()}
+        detail = "Товары восстановлены"
+
+    else:
+        target_id = data.target_wishlist_id
+        target_slug, count, max_pos = await get_owner_wishlist_state(target_id, user, db)
+
+        result = await db.execute(
+            select(WishlistItem.id, Wishlist.slug)
+            .where(
+                *owned,
+                WishlistItem.is_deleted == False,
+                WishlistItem.wishlist_id != target_id,
+            )
+            .order_by(WishlistItem.wishlist_id, WishlistItem.position)
+        )
+        moving = result.all()
+        if count + len(moving) > MAX_ITEMS_PER_WISHLIST:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Максимум {MAX_ITEMS_PER_WISHLIST} товаров в вишлисте",
+            )
+
+        events = {}
+        if moving:
+            # Reservations and contributions reference the item, so they move with it
+            new_positions = positions_values(
+                [
+                    (item_id, max_pos + i * ITEM_POSITION_GAP)
+                    for i, (item_id, _) in enumerate(moving, start=1)
+                ]
+            )
+            await db.execute(
+                update(WishlistItem)
+                .where(WishlistItem.id == new_positions.c.id)
+                .values(wishlist_id=target_id, position=new_positions.c.position)
+                .execution_options(synchronize_session=False)
+            )
+            events = {slug: ("items_deleted", ids) for slug, ids in group_ids_by_slug(moving).items()}
+            events[target_slug] = ("items_added", [str(item_id) for item_id, _ in moving])
+        detail = "Товары перенесены"
+
+    affected: set[str] = set()
+    for slug, (event_type, ids) in events.items():
+        affected.update(ids)
+        await manager.broadcast(slug, {"type": event_type, "item_ids": ids})
+
+    return {"detail": detail, "item_ids": [str(i) for i in item_ids if str(i) in affected]}
+
+
+async def rebalance_positions(db: AsyncSession, wishlist_id: UUID) -> dict[UUID, int]:
+    """Respace all positions of a wishlist by ITEM_POSITION_GAP in one statement.
+
+    Deleted items are included so a restore lands back in its old place.
+    """
+    ranked = (
+        select(
+            WishlistItem.id,
+            (
+                func.row_number().over(
+                    order_by=(WishlistItem.position, WishlistItem.created_at)
+                )
+                * ITEM_POSITION_GAP
+            ).label("position"),
+        )
+        .where(WishlistItem.wishlist_id == wishlist_id)
+        .subquery()
+    )
+    result = await db.execute(
+        update(WishlistItem)
+        .where(WishlistItem.id == ranked.c.id, WishlistItem.position != ranked.c.position)
+        .values(position=ranked.c.position)
+        .returning(WishlistItem.id, WishlistItem.position)
+        .execution_options(synchronize_session=False)
+    )
+    return dict(result.all())
+
+
+async def _rebalance_in_background(wishlist_id: UUID) -> None:
+    async with async_session() as db:
+        async with db.begin():
+            await rebalance_positions(db, wishlist_id)
+
+
+@router.patch("/items/{item_id}/move")
+async def move_item(
+    item_id: UUID,
+    data: ItemMove,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Move one item between two neighbours, rewriting only its own position."""
+    if data.prev_id == data.next_id or item_id in (data.prev_id, data.next_id):
+        raise HTTPException(status_code=400, detail="Некорректные соседи товара")
+
+    ids = {item_id, data.prev_id, data.next_id} - {None}
+    result = await db.execute(
+        select(WishlistItem.id, WishlistItem.wishlist_id, WishlistItem.position, Wishlist.slug)
+        .join(Wishlist, WishlistItem.wishlist_id == Wishlist.id)
         .where(
-            WishlistItem.id == item_id,
+            WishlistItem.id.in_(ids),
             Wishlist.user_id == user.id,
-            WishlistItem.is_deleted == True,
-        )
-        .options(
-            selectinload(WishlistItem.reservation),
-            selectinload(WishlistItem.contributions),
+            WishlistItem.is_deleted == False,
         )
     )
-    item = result.scalar_one_or_none()
-    if not item:
+    rows = {row.id: row for row in result.all()}
+    if len(rows) != len(ids) or len({row.wishlist_id for row in rows.values()}) != 1:
         raise HTTPException(status_code=404, detail="Товар не найден")
 
-    item.is_deleted = False
-    await db.flush()
+    wishlist_id = rows[item_id].wishlist_id
+    slug = rows[item_id].slug
+    positions = {row_id: row.position for row_id, row in rows.items()}
+
+    def gap() -> int:
+        return positions[data.next_id] - positions[data.prev_id]
+
+    if data.prev_id and data.next_id and gap() < 2:
+        # No room between the neighbours: respace the list, then retry.
+        # Respacing keeps the order, so it only helps neighbours that tie.
+        if gap() >= 0:
+            positions.update(await rebalance_positions(db, wishlist_id))
+        if gap() < 2:
+            # Neighbours given the wrong way round, or from a stale list
+            raise HTTPException(status_code=409, detail="Порядок изменился, обновите список")
+
+    if data.prev_id is None:
+        position = positions[data.next_id] - ITEM_POSITION_GAP
+    elif data.next_id is None:
+        position = positions[data.prev_id] + ITEM_POSITION_GAP
+    else:
+        position = (positions[data.prev_id] + positions[data.next_id]) // 2
+
+    await db.execute(
+        update(WishlistItem)
+        .where(WishlistItem.id == item_id)
+        .values(position=position)
+        .execution_options(synchronize_session=False)
+    )
 
-    slug = await get_wishlist_slug(item, db)
-    await manager.broadcast(slug, {"type": "item_added", "item_id": str(item.id)})
-    return item_to_response(item)
+    # Neighbours are now adjacent: respace once the move is committed (an
+    # earlier start would snapshot the old order and write it back) so the
+    # next drag into this spot does not have to
+    if (data.prev_id and position - positions[data.prev_id] < 2) or (
+        data.next_id and positions[data.next_id] - position < 2
+    ):
+        spawn_after_commit(
+            db, lambda: _rebalance_in_background(wishlist_id), name=f"rebalance-{wishlist_id}"
+        )
+
+    await manager.broadcast(slug, {"type": "items_reordered"})
+    return {"detail": "Порядок обновлён", "position": position}
 
 
 @router.patch("/wishlists/{wishlist_id}/items/reorder")
@@ -244,20 +556,30 @@ async def reorder_items(
 ):
     wishlist = await get_owner_wishlist(wishlist_id, user, db)
 
-    # Fetch all items in one query
-    result = await db.execute(
-        select(WishlistItem).where(
-            WishlistItem.wishlist_id == wishlist_id,
-            WishlistItem.is_deleted == False,
-        )
-    )
-    items_map = {str(item.id): item for item in result.scalars().all()}
+    # Keep the requested order but store sparse positions
+    ordered: list[UUID] = []
+    for reorder_item in sorted(data.items, key=lambda i: i.position):
+        try:
+            ordered.append(UUID(reorder_item.id))
+        except ValueError:
+            continue
 
-    for reorder_item in data.items:
-        item = items_map.get(reorder_item.id)
-        if item:
-            item.position = reorder_item.position
+    ordered = list(dict.fromkeys(ordered))
+    if ordered:
+        new_positions = positions_values(
+            [(item_id, i * ITEM_POSITION_GAP) for i, item_id in enumerate(ordered, start=1)]
+        )
+        await db.execute(
+            update(WishlistItem)
+            .where(
+                WishlistItem.id == new_positions.c.id,
+                WishlistItem.wishlist_id == wishlist_id,
+                WishlistItem.is_deleted == False,
+                WishlistItem.position != new_positions.c.position,
+            )
+            .values(position=new_positions.c.position)
+            .execution_options(synchronize_session=False)
+        )
 
-    await db.flush()
     await manager.broadcast(wishlist.slug, {"type": "items_reordered"})
     return {"detail": "Порядок обновлён"}
@@ -3,13 +3,20 @@ import secrets
 import uuid
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, status
+from sqlalchemy import func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_optional, get_db, get_wishlist_slug
+from app.api.deps import (
+    get_current_user_optional,
+    get_db,
+    get_db_readonly,
+    get_wishlist_meta,
+    get_wishlist_slug,
+)
 from app.core.config import settings
-from app.core.constants import CONTRIBUTE_RATE_LIMIT, RESERVE_RATE_LIMIT
+from app.core.constants import CONTRIBUTE_RATE_LIMIT, GUEST_RECOVER_RATE_LIMIT, RESERVE_RATE_LIMIT
+from app.core.database import async_session
 from app.core.limiter import limiter
 from app.core.security import create_guest_recovery_token, decode_guest_recovery_token
 from app.models.contribution import ItemContribution
@@ -49,10 +56,8 @@ async def get_item_for_update(item_id: uuid.UUID, db: AsyncSession) -> WishlistI
 
 async def verify_not_archived(item: WishlistItem, db: AsyncSession):
     """Block actions on archived wishlists."""
-    result = await db.execute(
-        select(Wishlist.is_archived).where(Wishlist.id == item.wishlist_id)
-    )
-    if result.scalar_one():
+    meta = await get_wishlist_meta(item.wishlist_id, db)
+    if meta.is_archived:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Вишлист в архиве",
@@ -62,11 +67,8 @@ async def verify_not_archived(item: WishlistItem, db: AsyncSession):
 async def verify_not_owner(item: WishlistItem, user: Optional[User], db: AsyncSession):
     """Ensure the current user is not the wishlist owner."""
     if user:
-        result = await db.execute(
-            select(Wishlist).where(Wishlist.id == item.wishlist_id)
-        )
-        wishlist = result.scalar_one_or_none()
-        if wishlist and wishlist.user_id == user.id:
+        meta = await get_wishlist_meta(item.wishlist_id, db)
+        if meta.user_id == user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Нельзя резервировать в своём вишлисте",
@@ -385,68 +387,87 @@ async def update_contribution_email(
 RECOVERY_RESPONSE = {"detail": "Если email найден, мы отправим ссылку для восстановления"}
 
 
-@router.post("/guest/recover")
-@limiter.limit("3/minute")
-async def guest_recover(
-    request: Request,
-    data: GuestRecoverRequest,
-    db: AsyncSession = Depends(get_db),
-):
-    """Find guest_token by email + slug and send recovery email."""
-    email = data.email.lower().strip()
-
-    # Find reservation or contribution with this email for this wishlist
-    result = await db.execute(
-        select(Wishlist).where(Wishlist.slug == data.wishlist_slug, Wishlist.is_deleted == False)
-    )
-    wishlist = result.scalar_one_or_none()
-    if not wishlist:
-        logger.info("Guest recovery: wishlist slug=%s not found", data.wishlist_slug)
-        return RECOVERY_RESPONSE
+async def _find_recovery_target(
+    db: AsyncSession, email: str, wishlist_slug: str
+) -> tuple[str, str] | None:
+    """Return (guest_token, wishlist_title) for a guest email on a wishlist.
 
-    # Check reservations
-    res_result = await db.execute(
-        select(ItemReservation)
-        .join(WishlistItem)
+    Reservations and contributions are searched in a single UNION ALL query
+    backed by the partial (guest_email, item_id) indexes.
+    """
+    reservations = (
+        select(ItemReservation.guest_token, Wishlist.title)
+        .join(WishlistItem, WishlistItem.id == ItemReservation.item_id)
+        .join(Wishlist, Wishlist.id == WishlistItem.wishlist_id)
         .where(
-            WishlistItem.wishlist_id == wishlist.id,
             ItemReservation.guest_email == email,
+            ItemReservation.guest_token.is_not(None),
+            Wishlist.slug == wishlist_slug,
+            Wishlist.is_deleted == False,
         )
     )
-    reservation = res_result.scalars().first()
-
-    # Check contributions
-    contrib_result = await db.execute(
-        select(ItemContribution)
-        .join(WishlistItem)
+    contributions = (
+        select(ItemContribution.guest_token, Wishlist.title)
+        .join(WishlistItem, WishlistItem.id == ItemContribution.item_id)
+        .join(Wishlist, Wishlist.id == WishlistItem.wishlist_id)
         .where(
-            WishlistItem.wishlist_id == wishlist.id,
             ItemContribution.guest_email == email,
+            ItemContribution.guest_token.is_not(None),
+            Wishlist.slug == wishlist_slug,
+            Wishlist.is_deleted == False,
         )
     )
-    contribution = contrib_result.scalars().first()
+    result = await db.execute(union_all(reservations, contributions).limit(1))
+    row = result.first()
+    return (row[0], row[1]) if row else None
+
+
+async def _send_guest_recovery(email: str, wishlist_slug: str) -> None:
+    """Background part of guest recovery: lookup + email, off the request path."""
+    try:
+        async with async_session() as db:
+            target = await _find_recovery_target(db, email, wishlist_slug)
+    except Exception:
+        logger.exception("Guest recovery lookup failed for slug=%s", wishlist_slug)
+        return
+
+    if not target:
+        logger.info("Guest recovery: no matching email for slug=%s", wishlist_slug)
+        return
 
-    guest_token = None
-    if reservation and reservation.guest_token:
-        guest_token = reservation.guest_token
-    elif contribution and contribution.guest_token:
-        guest_token = contribution.guest_token
+    guest_token, wishlist_title = target
+    recovery_token = create_guest_recovery_token(guest_token, wishlist_slug)
+    logger.info("Guest recovery: token generated for slug=%s", wishlist_slug)
 
-    if guest_token:
-        recovery_token = create_guest_recovery_token(guest_token, data.wishlist_slug)
-        logger.info("Guest recovery: token generated for slug=%s", data.wishlist_slug)
+    recovery_url = f"{settings.FRONTEND_URL}/w/{wishlist_slug}?recovery={recovery_token}"
+    await send_recovery_email(email, wishlist_title, recovery_url)
 
-        if settings.DEBUG:
-            # Dev mode: return token directly for testing
+
+@router.post("/guest/recover")
+@limiter.limit(GUEST_RECOVER_RATE_LIMIT)
+async def guest_recover(
+    request: Request,
+    data: GuestRecoverRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db_readonly),
+):
+    """Find guest_token by email + slug and send recovery email.
+
+    The lookup and email run as a background task, so the response takes
+    the same time whether or not the email is known.
+    """
+    email = data.email.lower().strip()
+
+    if settings.DEBUG:
+        # Dev mode: look up synchronously and return token directly for testing
+        target = await _find_recovery_target(db, email, data.wishlist_slug)
+        if target:
             logger.warning("DEV MODE: returning recovery token in response")
+            recovery_token = create_guest_recovery_token(target[0], data.wishlist_slug)
             return {**RECOVERY_RESPONSE, "recovery_token": recovery_token}
+        return RECOVERY_RESPONSE
 
-        # Production: send email with recovery link
-        recovery_url = f"{settings.FRONTEND_URL}/w/{data.wishlist_slug}?recovery={recovery_token}"
-        await send_recovery_email(email, wishlist.title, recovery_url)
-    else:
-        logger.info("Guest recovery: no matching email for slug=%s", data.wishlist_slug)
-
+    background_tasks.add_task(_send_guest_recovery, email, data.wishlist_slug)
     return RECOVERY_RESPONSE
 
 
@@ -1,48 +1,147 @@
+import asyncio
+import os
 import uuid
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import BinaryIO
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
 
 from app.api.deps import get_current_user
 from app.core.config import settings
-from app.core.constants import ALLOWED_IMAGE_TYPES, MAX_IMAGE_SIZE
+from app.core.constants import MAX_IMAGE_SIZE, UPLOAD_MULTIPART_OVERHEAD
 from app.models.user import User
 
 router = APIRouter()
 
-MIME_TO_EXT = {
-    "image/jpeg": "jpg",
-    "image/png": "png",
-    "image/webp": "webp",
-}
-
 UPLOAD_DIR = Path(settings.UPLOAD_DIR)
 
+# Whole request body: the image plus the multipart envelope around it
+_MAX_BODY = MAX_IMAGE_SIZE + UPLOAD_MULTIPART_OVERHEAD
+_SNIFF_BYTES = 12  # enough for every signature _sniff_ext knows
+
+_TOO_LARGE = "Максимальный размер файла — 5 МБ"
+_BAD_TYPE = "Допустимые форматы: JPEG, PNG, WebP"
+
 
 class UploadResponse(BaseModel):
     url: str
 
 
-@router.post("/upload", response_model=UploadResponse)
+class _FileParser(MultiPartParser):
+    """Writes the file part straight into ``out`` instead of a spooled temp file.
+
+    Saves copying every upload a second time on its way into UPLOAD_DIR.
+    """
+
+    def __init__(self, request: Request, out: BinaryIO) -> None:
+        super().__init__(request.headers, _capped(request.stream()), max_files=1, max_fields=0)
+        self._out = out
+
+    def on_headers_finished(self) -> None:
+        super().on_headers_finished()
+        upload = self._current_part.file
+        if upload is not None:
+            upload.file.close()  # the spooled file, still empty
+            upload.file = self._out
+
+
+def _sniff_ext(head: bytes) -> str | None:
+    """File extension from the magic bytes; the client's content type is not trusted."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+async def _capped(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Pass the body through, giving up as soon as it outgrows the limit."""
+    received = 0
+    async for chunk in stream:
+        received += len(chunk)
+        if received > _MAX_BODY:
+            raise HTTPException(413, _TOO_LARGE)
+        yield chunk
+
+
+def _check_request(request: Request) -> None:
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > _MAX_BODY:
+        raise HTTPException(413, _TOO_LARGE)
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(400, "Ожидается multipart/form-data")
+
+
+async def _receive_file(request: Request, out: BinaryIO) -> None:
+    """Stream the "file" part of the multipart body into ``out``."""
+    try:
+        form = await _FileParser(request, out).parse()
+    except MultiPartException as exc:
+        raise HTTPException(400, exc.message)
+    file = form.get("file")
+    if not isinstance(file, UploadFile):
+        raise HTTPException(400, "Файл не передан")
+    if file.size is not None and file.size > MAX_IMAGE_SIZE:
+        raise HTTPException(413, _TOO_LARGE)
+
+
+async def _store(request: Request) -> str:
+    """Receive the upload into UPLOAD_DIR; returns the final filename.
+
+    Data goes to a temp file next to the target and is renamed into place
+    once its magic bytes check out, so a half-written image is never served.
+    """
+    await asyncio.to_thread(UPLOAD_DIR.mkdir, parents=True, exist_ok=True)
+    tmp = UPLOAD_DIR / f".{uuid.uuid4()}.part"
+    out = await asyncio.to_thread(open, tmp, "w+b")
+    try:
+        await _receive_file(request, out)
+        await asyncio.to_thread(out.seek, 0)
+        ext = _sniff_ext(await asyncio.to_thread(out.read, _SNIFF_BYTES))
+        if ext is None:
+            raise HTTPException(400, _BAD_TYPE)
+        await asyncio.to_thread(out.close)
+        filename = f"{uuid.uuid4()}.{ext}"
+        await asyncio.to_thread(os.replace, tmp, UPLOAD_DIR / filename)
+    except BaseException:
+        await asyncio.to_thread(out.close)
+        await asyncio.to_thread(tmp.unlink, missing_ok=True)
+        raise
+    return filename
+
+
+@router.post(
+    "/upload",
+    response_model=UploadResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"file": {"type": "string", "format": "binary"}},
+                        "required": ["file"],
+                    }
+                }
+            },
+        }
+    },
+)
 async def upload_image(
-    file: UploadFile,
+    request: Request,
     user: User = Depends(get_current_user),
 ):
-    if file.content_type not in ALLOWED_IMAGE_TYPES:
-        raise HTTPException(400, "Допустимые форматы: JPEG, PNG, WebP")
-
-    data = await file.read()
-    if len(data) > MAX_IMAGE_SIZE:
-        raise HTTPException(400, "Максимальный размер файла — 5 МБ")
-
-    ext = MIME_TO_EXT.get(file.content_type, "jpg")
-    filename = f"{uuid.uuid4()}.{ext}"
-
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = UPLOAD_DIR / filename
-    filepath.write_bytes(data)
+    """Stream an image into UPLOAD_DIR without holding it in memory."""
+    _check_request(request)
+    filename = await _store(request)
 
     base_url = settings.BASE_URL.rstrip("/")
     return UploadResponse(url=f"{base_url}/api/uploads/{filename}")
@@ -50,11 +149,12 @@ async def upload_image(
 
 @router.get("/uploads/{filename}")
 async def get_upload(filename: str):
-    if "/" in filename or "\\" in filename or ".." in filename:
+    # Dotfiles are uploads still being written
+    if "/" in filename or "\\" in filename or ".." in filename or filename.startswith("."):
         raise HTTPException(400, "Invalid filename")
 
     filepath = UPLOAD_DIR / filename
-    if not filepath.exists():
+    if not await asyncio.to_thread(filepath.is_file):
         raise HTTPException(404, "File not found")
 
     ext = filepath.suffix.lower()
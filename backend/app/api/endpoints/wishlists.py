@@ -1,11 +1,13 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import Uuid, false, func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_current_user_readonly, get_db, get_db_readonly
 from app.core.constants import DEFAULT_PAGE_SIZE, MAX_WISHLISTS_PER_USER
+from app.core.database import after_commit, utcnow
+from app.core.wishlist_cache import invalidate_wishlist
 from app.core.ws_manager import manager
 from app.models.user import User
 from app.models.wishlist import Wishlist
@@ -13,7 +15,7 @@ from app.models.item import WishlistItem
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.wishlist import WishlistCreate, WishlistResponse, WishlistUpdate
 from app.utils.pagination import paginate
-from app.utils.slug import create_unique_slug
+from app.utils.slug import insert_wishlist_with_slug
 
 router = APIRouter(prefix="/wishlists", tags=["wishlists"])
 
@@ -34,12 +36,26 @@ def wishlist_to_response(w: Wishlist, items_count: int = 0) -> WishlistResponse:
     )
 
 
+async def check_wishlist_limit(user: User, db: AsyncSession) -> None:
+    count_result = await db.execute(
+        select(func.count(Wishlist.id)).where(
+            Wishlist.user_id == user.id, Wishlist.is_deleted == False
+        )
+    )
+    count = count_result.scalar_one()
+    if count >= MAX_WISHLISTS_PER_USER:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Максимум {MAX_WISHLISTS_PER_USER} вишлистов",
+        )
+
+
 @router.get("", response_model=PaginatedResponse[WishlistResponse])
 async def list_wishlists(
     page: int = Query(1, ge=1),
     per_page: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=100),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     query = (
         select(Wishlist)
@@ -74,31 +90,18 @@ async def create_wishlist(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    # Check limit
-    count_result = await db.execute(
-        select(func.count(Wishlist.id)).where(
-            Wishlist.user_id == user.id, Wishlist.is_deleted == False
-        )
-    )
-    count = count_result.scalar_one()
-    if count >= MAX_WISHLISTS_PER_USER:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Максимум {MAX_WISHLISTS_PER_USER} вишлистов",
-        )
+    await check_wishlist_limit(user, db)
 
-    slug = await create_unique_slug(data.title, db)
-
-    wishlist = Wishlist(
-        user_id=user.id,
-        title=data.title.strip(),
-        description=data.description.strip() if data.description else None,
-        slug=slug,
-        emoji=data.emoji,
-        event_date=data.event_date,
+    wishlist = await insert_wishlist_with_slug(
+        db,
+        {
+            "user_id": user.id,
+            "title": data.title.strip(),
+            "description": data.description.strip() if data.description else None,
+            "emoji": data.emoji,
+            "event_date": data.event_date,
+        },
     )
-    db.add(wishlist)
-    await db.flush()
 
     return wishlist_to_response(wishlist)
 
@@ -106,8 +109,8 @@ async def create_wishlist(
 @router.get("/{wishlist_id}", response_model=WishlistResponse)
 async def get_wishlist(
     wishlist_id: UUID,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user_readonly),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     result = await db.execute(
         select(Wishlist).where(
@@ -161,6 +164,7 @@ async def update_wishlist(
         setattr(wishlist, field, value)
 
     await db.flush()
+    after_commit(db, lambda: invalidate_wishlist(wishlist.id))
 
     await manager.broadcast(wishlist.slug, {"type": "wishlist_updated"})
     return wishlist_to_response(wishlist)
@@ -185,6 +189,7 @@ async def delete_wishlist(
 
     wishlist.is_deleted = True
     await db.flush()
+    after_commit(db, lambda: invalidate_wishlist(wishlist.id))
 
     await manager.broadcast(wishlist.slug, {"type": "wishlist_deleted"})
     await manager.close_all(wishlist.slug)
@@ -210,6 +215,67 @@ async def restore_wishlist(
 
     wishlist.is_deleted = False
     await db.flush()
+    after_commit(db, lambda: invalidate_wishlist(wishlist.id))
 
     await manager.broadcast(wishlist.slug, {"type": "wishlist_updated"})
     return wishlist_to_response(wishlist)
+
+
+@router.post("/{wishlist_id}/duplicate", response_model=WishlistResponse, status_code=status.HTTP_201_CREATED)
+async def duplicate_wishlist(
+    wishlist_id: UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Copy a wishlist with its items; reservations and contributions are not copied."""
+    result = await db.execute(
+        select(Wishlist).where(
+            Wishlist.id == wishlist_id,
+            Wishlist.user_id == user.id,
+            Wishlist.is_deleted == False,
+        )
+    )
+    source = result.scalar_one_or_none()
+    if not source:
+        raise HTTPException(status_code=404, detail="Вишлист не найден")
+
+    await check_wishlist_limit(user, db)
+
+    wishlist = await insert_wishlist_with_slug(
+        db,
+        {
+            "user_id": user.id,
+            "title": source.title,
+            "description": source.description,
+            "emoji": source.emoji,
+            "event_date": source.event_date,
+        },
+    )
+
+    now = utcnow()
+    copy_result = await db.execute(
+        insert(WishlistItem).from_select(
+            [
+                "id", "wishlist_id", "title", "url", "price", "image_url", "note",
+                "is_deleted", "position", "created_at", "updated_at",
+            ],
+            select(
+                func.gen_random_uuid(),
+                literal(wishlist.id, Uuid),
+                WishlistItem.title,
+                WishlistItem.url,
+                WishlistItem.price,
+                WishlistItem.image_url,
+                WishlistItem.note,
+                false(),
+                WishlistItem.position,
+                literal(now),
+                literal(now),
+            ).where(
+                WishlistItem.wishlist_id == source.id,
+                WishlistItem.is_deleted == False,
+            ),
+        )
+    )
+
+    return wishlist_to_response(wishlist, copy_result.rowcount)
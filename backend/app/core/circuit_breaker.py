@@ -0,0 +1,131 @@
+import time
+from collections import OrderedDict, deque
+
+import httpx
+
+from app.core.constants import (
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MAX_HOSTS,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_WINDOW,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Failure-rate breaker for one upstream host.
+
+    Closed: calls go through and outcomes land in a sliding window. Once the
+    window holds CIRCUIT_MIN_CALLS and the failure share reaches
+    CIRCUIT_FAILURE_RATE, the circuit opens and calls fail fast. After
+    CIRCUIT_OPEN_SECONDS one trial call is let through (half-open): success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state = CLOSED
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.rejected = 0
+
+    def acquire(self) -> None:
+        """Claim permission to call; raises CircuitOpenError when refused."""
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < CIRCUIT_OPEN_SECONDS:
+                self.rejected += 1
+                raise CircuitOpenError(f"Circuit open for {self.host}")
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._trial_running:
+                self.rejected += 1
+                raise CircuitOpenError(f"Circuit half-open for {self.host}")
+            self._trial_running = True
+
+    def release(self) -> None:
+        """Give back a claim that ended without a verdict (e.g. cancelled)."""
+        self._trial_running = False
+
+    def record(self, ok: bool) -> None:
+        now = time.monotonic()
+        if self.state == HALF_OPEN:
+            self._trial_running = False
+            if ok:
+                self.state = CLOSED
+                self._outcomes.clear()
+                self._failures = 0
+            else:
+                self._open(now)
+            return
+        if self.state == OPEN:
+            return  # a call that started before the circuit opened
+
+        self._outcomes.append((now, ok))
+        if not ok:
+            self._failures += 1
+        self._trim(now)
+        calls = len(self._outcomes)
+        if calls >= CIRCUIT_MIN_CALLS and self._failures / calls >= CIRCUIT_FAILURE_RATE:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self._failures = 0
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > CIRCUIT_WINDOW:
+            _, ok = self._outcomes.popleft()
+            if not ok:
+                self._failures -= 1
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        self._trim(now)
+        calls = len(self._outcomes)
+        snapshot = {
+            "state": self.state,
+            "calls": calls,
+            "failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+            "rejected": self.rejected,
+        }
+        if self.state == OPEN:
+            snapshot["retry_in"] = round(max(0.0, CIRCUIT_OPEN_SECONDS - (now - self._opened_at)), 1)
+        return snapshot
+
+
+# LRU of breakers: URLs come from users, so the host set is unbounded
+_breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = CircuitBreaker(host)
+        _breakers[host] = breaker
+        if len(_breakers) > CIRCUIT_MAX_HOSTS:
+            _breakers.popitem(last=False)
+    else:
+        _breakers.move_to_end(host)
+    return breaker
+
+
+def circuit_stats() -> dict:
+    """Hosts with recent traffic or a circuit that is not closed."""
+    stats = {}
+    for host, breaker in _breakers.items():
+        snapshot = breaker.snapshot()
+        if snapshot["state"] != CLOSED or snapshot["calls"]:
+            stats[host] = snapshot
+    return stats
@@ -4,10 +4,17 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://localhost:5432/vishlist"
+    # Optional streaming replica for read-only endpoints; empty = use primary
+    DATABASE_REPLICA_URL: str = ""
     SECRET_KEY: str = "dev-secret-key-change-in-production-min-32-chars"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
 
+    # Password hashing (bcrypt runs on a dedicated thread pool)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # running + queued, beyond that → 503
+
     DEBUG: bool = False
 
     FRONTEND_URL: str = "http://localhost:3000"
@@ -15,17 +22,26 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
     GOOGLE_REDIRECT_URI: str = "http://localhost:8000/api/auth/google/callback"
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
 
     RESEND_API_KEY: str = ""
     RESEND_FROM_EMAIL: str = "noreply@vishlist.app"
 
     VERCEL_BLOB_READ_WRITE_TOKEN: str = ""
 
+    # How far into a page the URL parser reads looking for a price; reading
+    # always stops at </head> once this much has been read
+    URL_PARSER_PRICE_SCAN_BYTES: int = 50_000
+    HTML_PARSE_WORKERS: int = 2  # threads for page metadata extraction
+
+    # Keep URL parse results in Postgres too, so they survive restarts
+    PARSE_CACHE_DB: bool = False
+
     # Local file uploads (Railway Volume or local dir)
     UPLOAD_DIR: str = "/data/uploads"
     BASE_URL: str = "http://localhost:8000"
 
-    @field_validator("DATABASE_URL")
+    @field_validator("DATABASE_URL", "DATABASE_REPLICA_URL")
     @classmethod
     def fix_database_url(cls, v: str) -> str:
         if v and v.startswith("postgresql://"):
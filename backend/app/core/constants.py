@@ -8,6 +8,9 @@ MAX_ITEM_TITLE_LENGTH = 200
 MAX_ITEM_NOTE_LENGTH = 500
 MAX_GUEST_NAME_LENGTH = 50
 
+# Item ordering: positions are spaced so a drag rewrites only the moved item
+ITEM_POSITION_GAP = 1024
+
 # Pagination defaults
 DEFAULT_PAGE_SIZE = 20
 DEFAULT_ITEMS_PAGE_SIZE = 50
@@ -17,20 +20,100 @@ MAX_PAGE_SIZE = 100
 LOGIN_RATE_LIMIT = "5/minute"
 REGISTER_RATE_LIMIT = "3/minute"
 URL_PARSER_RATE_LIMIT = "10/minute"
+URL_PARSER_BATCH_RATE_LIMIT = "100/minute"  # charged per distinct URL
 GUEST_RECOVER_RATE_LIMIT = "3/minute"
 RESERVE_RATE_LIMIT = "10/minute"
 CONTRIBUTE_RATE_LIMIT = "10/minute"
 
+# Password hashing pool
+PASSWORD_HASH_RETRY_AFTER = 5  # seconds, sent with 503 when the pool is full
+PASSWORD_HASH_SLOW_QUEUE = 1.0  # seconds in queue before we log a warning
+
 # WebSocket
 WS_PING_INTERVAL = 30  # seconds
 
 # URL parser
 URL_PARSER_TIMEOUT = 5  # seconds
 URL_PARSER_MAX_CONTENT_LENGTH = 1_000_000  # 1 MB
+URL_PARSER_MAX_REDIRECTS = 3
+MARKETPLACE_DEFAULT_CONCURRENCY = 4  # in-flight fast-path calls per adapter
+URL_PARSER_BATCH_MAX_URLS = 50
+URL_PARSER_BATCH_CONCURRENCY = 32  # URLs parsed at once across all batches
+URL_PARSER_BATCH_PER_HOST = 4  # URLs per host parsed at once within one batch
+
+# Wildberries CDN basket discovery
+WB_BASKET_VOLS_PER_BASKET = 216  # width of recent baskets, for extrapolation
+WB_BASKET_PROBE_SPAN = 5  # baskets probed either side of the guess
+WB_BASKET_PROBE_TIMEOUT = 3  # seconds
+WB_BASKET_REPROBE_INTERVAL = 300  # seconds before a volume is probed again
+WB_PRICE_DEADLINE = 4  # seconds into a fetch; under URL_PARSER_TIMEOUT so the card still gets out
+
+# URL parse result cache (canonical URL -> ParseUrlResponse)
+PARSE_CACHE_TTL = 3600  # seconds, both memory and Postgres tiers
+PARSE_CACHE_NEGATIVE_TTL = 60  # seconds, for failed fetches (memory only)
+PARSE_CACHE_MAX_SIZE = 5000
+PARSE_CACHE_PRUNE_INTERVAL = 3600  # seconds between deletes of expired rows
+
+# Shared outbound HTTP client (URL parser)
+HTTP_CLIENT_CONNECT_TIMEOUT = 3  # seconds
+HTTP_CLIENT_POOL_TIMEOUT = 2  # seconds waiting for a free connection
+HTTP_CLIENT_MAX_CONNECTIONS = 100
+HTTP_CLIENT_MAX_KEEPALIVE = 20
+HTTP_CLIENT_KEEPALIVE_EXPIRY = 90  # seconds
+HTTP_CLIENT_PER_HOST_LIMIT = 8  # concurrent requests per host
+HTTP_HEDGE_DELAY = 0.5  # seconds before a hedged request sends its duplicate
+
+# Per-host circuit breakers for outbound requests
+CIRCUIT_WINDOW = 30  # seconds of outcomes the failure rate is computed over
+CIRCUIT_MIN_CALLS = 5  # calls in the window before the circuit may open
+CIRCUIT_FAILURE_RATE = 0.5
+CIRCUIT_OPEN_SECONDS = 30  # fail fast for this long, then let one trial call through
+CIRCUIT_MAX_HOSTS = 2048  # least recently used breakers are dropped past this
+
+# DNS cache for the SSRF guard; getaddrinfo exposes no record TTLs,
+# so this short cap stands in for them
+DNS_CACHE_TTL = 60  # seconds
+DNS_CACHE_MAX_SIZE = 4096
 
 # Image upload
 MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5 MB
-ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
+UPLOAD_MULTIPART_OVERHEAD = 16 * 1024  # boundaries and part headers around the file
+
+# Mirroring of remote item images into UPLOAD_DIR
+IMAGE_MIRROR_WIDTH = 800  # max width of the WebP copy items point at
+IMAGE_MIRROR_QUALITY = 80
+IMAGE_MIRROR_MAX_PIXELS = 40_000_000  # refuse to decode anything bigger
+IMAGE_MIRROR_ATTEMPTS = 3  # per mirroring run, for network errors and 5xx
+IMAGE_MIRROR_BACKOFF = 2  # seconds before the second attempt, doubling after
+IMAGE_MIRROR_RETRY_AFTER = 24 * 3600  # seconds a failed source is left alone
+IMAGE_MIRROR_CONCURRENCY = 4  # downloads at once per process
+IMAGE_MIRROR_GC_INTERVAL = 6 * 3600  # seconds between sweeps for unused copies
+IMAGE_MIRROR_GC_GRACE = 7 * 24 * 3600  # seconds a copy stays after its last use
+
+# Wishlist metadata cache (id -> slug, owner, flags)
+WISHLIST_CACHE_TTL = 30  # seconds
+WISHLIST_CACHE_MAX_SIZE = 10_000
+
+# Read-your-writes: clients send this header for a few seconds after a
+# mutation so their reads skip a possibly lagging replica
+READ_PRIMARY_HEADER = "X-Read-Primary"
+
+# Authenticated principal cache (token -> user snapshot)
+PRINCIPAL_CACHE_TTL = 60  # seconds, never past the token's exp
+PRINCIPAL_CACHE_MAX_SIZE = 10_000
+
+# Google id_token verification (JWKS cache)
+GOOGLE_JWKS_DEFAULT_MAX_AGE = 3600  # seconds, when Cache-Control has none
+GOOGLE_JWKS_REFRESH_AHEAD = 300  # refresh this long before expiry
+GOOGLE_JWKS_RETRY_INTERVAL = 30  # seconds between failed background refreshes
+GOOGLE_JWKS_MIN_REFRESH_INTERVAL = 30  # throttle for unknown-kid refreshes
+GOOGLE_JWKS_FETCH_TIMEOUT = 5  # seconds
+
+# Access token revocation (in-memory mirror of revoked_tokens)
+REVOCATION_SYNC_INTERVAL = 15  # seconds
+REVOCATION_SYNC_OVERLAP = 60  # seconds re-read on each incremental sync
+REVOCATION_FULL_RELOAD_INTERVAL = 3600  # seconds, also prunes expired rows
+REVOCATION_FILTER_CAPACITY = 100_000
 
 # Guest recovery token
 GUEST_RECOVERY_TOKEN_EXPIRE_MINUTES = 60  # 1 hour
@@ -1,5 +1,7 @@
+from collections.abc import Callable
 from datetime import datetime, timezone
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -23,6 +25,41 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Reads go to the replica when one is configured, otherwise they share the
+# primary pool. Either way every transaction opened here is READ ONLY.
+read_engine = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+    )
+    if settings.DATABASE_REPLICA_URL
+    else engine
+)
+
+async_session_read = async_sessionmaker(
+    read_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Read-only session pinned to the primary, for read-your-writes requests.
+async_session_read_primary = async_sessionmaker(
+    engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     pass
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's transaction commits; never if it rolls back.
+
+    For cache invalidation and follow-up work that must not observe (or be
+    overtaken by) the pre-commit state of the rows being written.
+    """
+    event.listen(session.sync_session, "after_commit", lambda _: callback(), once=True)
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import re
+import time
+
+import httpx
+import jwt
+
+from app.core.config import settings
+from app.core.constants import (
+    GOOGLE_JWKS_DEFAULT_MAX_AGE,
+    GOOGLE_JWKS_FETCH_TIMEOUT,
+    GOOGLE_JWKS_MIN_REFRESH_INTERVAL,
+    GOOGLE_JWKS_REFRESH_AHEAD,
+    GOOGLE_JWKS_RETRY_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(cache_control: str) -> int:
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else GOOGLE_JWKS_DEFAULT_MAX_AGE
+
+
+class GoogleKeySet:
+    """Google's signing keys, cached for as long as Cache-Control allows.
+
+    A background loop refreshes the set ahead of expiry, so verification
+    normally never waits on the network. A token signed with an unknown kid
+    (Google rotated keys) triggers a throttled on-demand refresh.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._expires_at = 0.0  # monotonic
+        self._last_fetch = float("-inf")
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        return bool(self._keys) and time.monotonic() < self._expires_at
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._fetch()
+
+    async def _fetch(self) -> None:
+        try:
+            async with httpx.AsyncClient(timeout=GOOGLE_JWKS_FETCH_TIMEOUT) as client:
+                response = await client.get(self.url)
+                response.raise_for_status()
+        finally:
+            self._last_fetch = time.monotonic()
+        keys = {}
+        for data in response.json().get("keys", []):
+            try:
+                keys[data["kid"]] = jwt.PyJWK(data, algorithm="RS256")
+            except (KeyError, jwt.PyJWTError) as exc:
+                logger.warning("Skipping unusable Google JWK: %s", exc)
+        if not keys:
+            raise ValueError("Google JWKS contains no usable keys")
+        self._keys = keys
+        self._expires_at = self._last_fetch + _max_age(
+            response.headers.get("cache-control", "")
+        )
+        logger.info("Google JWKS refreshed: %d keys", len(keys))
+
+    async def run_refresher(self) -> None:
+        """Keep the key set fresh until cancelled."""
+        while True:
+            try:
+                await self.refresh()
+                delay = self._expires_at - time.monotonic() - GOOGLE_JWKS_REFRESH_AHEAD
+            except (httpx.HTTPError, ValueError) as exc:
+                logger.warning("Google JWKS refresh failed: %s", exc)
+                delay = GOOGLE_JWKS_RETRY_INTERVAL
+            await asyncio.sleep(max(delay, GOOGLE_JWKS_RETRY_INTERVAL))
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        if not self.is_fresh:
+            await self._try_refresh()
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_fetch >= GOOGLE_JWKS_MIN_REFRESH_INTERVAL:
+            await self._try_refresh()
+            key = self._keys.get(kid)
+        if key is None:
+            raise ValueError(f"Unknown Google key id: {kid}")
+        return key
+
+    async def _try_refresh(self) -> None:
+        started = time.monotonic()
+        async with self._lock:
+            # Another caller fetched while we waited for the lock
+            if self._last_fetch >= started:
+                return
+            try:
+                await self._fetch()
+            except (httpx.HTTPError, ValueError) as exc:
+                # Stale keys are still better than none; verification decides
+                logger.warning("Google JWKS refresh failed: %s", exc)
+
+    async def verify(self, token: str, audience: str) -> dict:
+        """Verify a Google id_token locally; raises ValueError when invalid."""
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as exc:
+            raise ValueError(str(exc)) from exc
+        key = await self.get_key(header.get("kid", ""))
+        try:
+            return jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=audience,
+                issuer=GOOGLE_ISSUERS,
+            )
+        except jwt.PyJWTError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+google_keys = GoogleKeySet(settings.GOOGLE_JWKS_URL)
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import socket
+import weakref
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+
+import httpx
+
+from app.core.circuit_breaker import breaker_for
+from app.core.constants import (
+    HTTP_CLIENT_CONNECT_TIMEOUT,
+    HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_KEEPALIVE,
+    HTTP_CLIENT_PER_HOST_LIMIT,
+    HTTP_CLIENT_POOL_TIMEOUT,
+    URL_PARSER_MAX_REDIRECTS,
+    URL_PARSER_TIMEOUT,
+)
+from app.utils.ssrf import BlockedHostError, resolve_public_ip, validate_redirect
+
+logger = logging.getLogger(__name__)
+
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+_client: httpx.AsyncClient | None = None
+
+# CA bundle for pinned fetches, loaded once rather than per client
+_pinned_ssl_context = httpx.create_ssl_context()
+
+# Per-host concurrency caps; a semaphore lives only while someone holds it
+_host_slots: weakref.WeakValueDictionary[str, asyncio.Semaphore] = weakref.WeakValueDictionary()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _create_client() -> httpx.AsyncClient:
+    http2 = _http2_available()
+    logger.info("Outbound HTTP client started (http2=%s)", http2)
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(
+            URL_PARSER_TIMEOUT,
+            connect=HTTP_CLIENT_CONNECT_TIMEOUT,
+            pool=HTTP_CLIENT_POOL_TIMEOUT,
+        ),
+        limits=httpx.Limits(
+            max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+        max_redirects=URL_PARSER_MAX_REDIRECTS,
+        headers={"User-Agent": BROWSER_USER_AGENT},
+        event_hooks={"response": [validate_redirect]},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The application-wide client; created on first use outside the lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def host_slot(host: str):
+    """Cap concurrent outbound requests to one host.
+
+    Waiting for a slot is bounded too, so a stalled host can't queue up
+    every request aimed at it.
+    """
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = asyncio.Semaphore(HTTP_CLIENT_PER_HOST_LIMIT)
+        _host_slots[host] = slot
+    try:
+        async with asyncio.timeout(HTTP_CLIENT_POOL_TIMEOUT):
+            await slot.acquire()
+    except TimeoutError:
+        raise httpx.PoolTimeout(f"No free slot for {host}") from None
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+def _healthy(response: httpx.Response) -> bool:
+    return response.status_code < 500 and response.status_code != 429
+
+
+async def _send(host: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+    """Run one upstream call through the host's circuit breaker."""
+    breaker = breaker_for(host)
+    breaker.acquire()
+    recorded = False
+    try:
+        try:
+            response = await send()
+        except httpx.PoolTimeout:
+            raise  # our own pool is short, not the upstream's fault
+        except httpx.TransportError:
+            breaker.record(False)
+            recorded = True
+            raise
+        breaker.record(_healthy(response))
+        recorded = True
+        return response
+    finally:
+        if not recorded:
+            breaker.release()
+
+
+async def _guarded_get(url: str, kwargs: dict) -> httpx.Response:
+    host = httpx.URL(url).host
+    async with host_slot(host):
+        return await _send(host, lambda: get_http_client().get(url, **kwargs))
+
+
+async def http_get(url: str, hedge_after: float | None = None, **kwargs) -> httpx.Response:
+    """GET through the shared pool, per-host concurrency cap and circuit breaker.
+
+    With ``hedge_after``, a second identical request is sent if the first has
+    not answered within that many seconds; whichever finishes first wins.
+    Only for idempotent calls to hosts we trust with the extra load.
+    """
+    if hedge_after is None:
+        return await _guarded_get(url, kwargs)
+
+    attempts = {asyncio.create_task(_guarded_get(url, kwargs))}
+    try:
+        done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+        if not done:
+            attempts.add(asyncio.create_task(_guarded_get(url, kwargs)))
+        error: BaseException | None = None
+        while attempts:
+            done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in attempts:
+            task.cancel()
+
+
+def _pinned_client() -> httpx.AsyncClient:
+    """Client for one pinned fetch, closed with it.
+
+    The shared pool keys connections by the address it dialled, so a
+    connection opened for one name (and its certificate) could be handed to
+    another name on the same IP. Here nothing outlives the fetch.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            verify=_pinned_ssl_context,
+            limits=httpx.Limits(max_keepalive_connections=0),
+        ),
+        timeout=httpx.Timeout(URL_PARSER_TIMEOUT, connect=HTTP_CLIENT_CONNECT_TIMEOUT),
+        headers={"User-Agent": BROWSER_USER_AGENT},
+    )
+
+
+@asynccontextmanager
+async def stream_pinned(url: str, headers: dict[str, str] | None = None):
+    """Stream a GET of an untrusted URL, following redirects by hand.
+
+    Each hop connects to the address that passed the SSRF check; the original
+    name is kept for the Host header and for TLS (SNI and certificate check).
+    Every hop gets a fresh connection, never one made for another name.
+    The body is left unread so the caller can stop early.
+    """
+    target = httpx.URL(url)
+    async with _pinned_client() as client:
+        for _ in range(URL_PARSER_MAX_REDIRECTS + 1):
+            if target.scheme not in ("http", "https"):
+                raise BlockedHostError(str(target))
+            try:
+                ip = await resolve_public_ip(target.host)
+            except socket.gaierror as exc:
+                raise httpx.ConnectError(str(exc)) from exc
+            request = client.build_request(
+                "GET",
+                target.copy_with(host=ip),
+                headers={**(headers or {}), "Host": target.netloc.decode("ascii")},
+                extensions={"sni_hostname": target.host},
+            )
+            async with host_slot(target.host):
+                response = await _send(target.host, lambda: client.send(request, stream=True))
+                if not response.has_redirect_location:
+                    try:
+                        yield response
+                    finally:
+                        await response.aclose()
+                    return
+                await response.aclose()
+            target = target.join(response.headers["location"])
+    raise httpx.TooManyRedirects("Exceeded maximum allowed redirects", request=request)
@@ -1,4 +1,5 @@
 from fastapi import Request
+from limits import parse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
@@ -13,3 +14,13 @@ def get_real_ip(request: Request) -> str:
 
 
 limiter = Limiter(key_func=get_real_ip)
+
+
+def charge(request: Request, limit_value: str, scope: str, cost: int) -> bool:
+    """Hit a per-IP limit with a cost known only after the body is parsed.
+
+    Returns False when the client is over the limit.
+    """
+    if not limiter.enabled:
+        return True
+    return limiter.limiter.hit(parse(limit_value), get_real_ip(request), scope, cost=cost)
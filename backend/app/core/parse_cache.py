@@ -0,0 +1,123 @@
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import NamedTuple
+
+from fastapi import HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.constants import (
+    PARSE_CACHE_MAX_SIZE,
+    PARSE_CACHE_NEGATIVE_TTL,
+    PARSE_CACHE_PRUNE_INTERVAL,
+    PARSE_CACHE_TTL,
+)
+from app.core.database import async_session, async_session_read, utcnow
+from app.models.parsed_url import ParsedUrl
+from app.schemas.parse_url import ParseUrlResponse
+from app.utils.cache import SingleFlight, TTLCache
+from app.utils.tasks import spawn
+
+logger = logging.getLogger(__name__)
+
+
+class ParseFailure(NamedTuple):
+    """Negative cache entry: the error a parse of this URL just produced."""
+
+    status_code: int
+    detail: str
+
+
+_memory: TTLCache[str, ParseUrlResponse | ParseFailure] = TTLCache(
+    maxsize=PARSE_CACHE_MAX_SIZE, ttl=PARSE_CACHE_TTL
+)
+_flights: SingleFlight[str, ParseUrlResponse | ParseFailure] = SingleFlight()
+_last_prune = 0.0  # monotonic
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+async def cached_parse(
+    url: str, parse: Callable[[], Awaitable[ParseUrlResponse]]
+) -> ParseUrlResponse:
+    """Run ``parse`` at most once per TTL for a canonical URL, sharing in-flight parses.
+
+    ``url`` is only the cache key; ``parse`` fetches whatever link it was
+    built for. Failures (HTTPException from ``parse``) are cached briefly
+    and re-raised.
+    """
+    result = _memory.get(url)
+    if result is None:
+        result = await _flights.do(url, lambda: _load(url, parse))
+    if isinstance(result, ParseFailure):
+        raise HTTPException(status_code=result.status_code, detail=result.detail)
+    return result
+
+
+async def _load(
+    url: str, parse: Callable[[], Awaitable[ParseUrlResponse]]
+) -> ParseUrlResponse | ParseFailure:
+    if settings.PARSE_CACHE_DB:
+        stored = await _db_get(url)
+        if stored is not None:
+            return stored
+    try:
+        result = await parse()
+    except HTTPException as exc:
+        failure = ParseFailure(exc.status_code, exc.detail)
+        _memory.set(url, failure, ttl=PARSE_CACHE_NEGATIVE_TTL)
+        return failure
+    _memory.set(url, result)
+    if settings.PARSE_CACHE_DB:
+        spawn(_db_store(url, result), name="parse-cache-store")
+    return result
+
+
+async def _db_get(url: str) -> ParseUrlResponse | None:
+    try:
+        async with async_session_read() as db:
+            row = (
+                await db.execute(
+                    select(ParsedUrl.data, ParsedUrl.expires_at).where(
+                        ParsedUrl.url_hash == _url_hash(url),
+                        ParsedUrl.expires_at > utcnow(),
+                    )
+                )
+            ).one_or_none()
+    except Exception:
+        logger.exception("Parse cache lookup failed")
+        return None
+    if row is None:
+        return None
+    result = ParseUrlResponse(**row.data)
+    _memory.set(url, result, ttl=(row.expires_at - utcnow()).total_seconds())
+    return result
+
+
+async def _db_store(url: str, result: ParseUrlResponse) -> None:
+    global _last_prune
+    now = utcnow()
+    values = {
+        "url_hash": _url_hash(url),
+        "url": url,
+        "data": result.model_dump(),
+        "expires_at": now + timedelta(seconds=PARSE_CACHE_TTL),
+        "created_at": now,
+    }
+    stmt = insert(ParsedUrl).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ParsedUrl.url_hash],
+        set_={"data": stmt.excluded.data, "expires_at": stmt.excluded.expires_at},
+    )
+    async with async_session() as db:
+        async with db.begin():
+            await db.execute(stmt)
+            if time.monotonic() - _last_prune >= PARSE_CACHE_PRUNE_INTERVAL:
+                _last_prune = time.monotonic()
+                await db.execute(delete(ParsedUrl).where(ParsedUrl.expires_at <= now))
@@ -0,0 +1,43 @@
+import logging
+import time
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.constants import PRINCIPAL_CACHE_MAX_SIZE, PRINCIPAL_CACHE_TTL
+from app.models.user import User
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPrincipal(NamedTuple):
+    user: User
+    jti: str | None  # still checked against the revocation list on hits
+
+
+# Verified access token -> detached snapshot of its user. A hit skips both
+# the JWT signature check and the users query.
+principal_cache: TTLCache[str, CachedPrincipal] = TTLCache(
+    maxsize=PRINCIPAL_CACHE_MAX_SIZE, ttl=PRINCIPAL_CACHE_TTL
+)
+
+
+def _snapshot(user: User) -> User:
+    """Detached copy of the user row that is safe to share between requests."""
+    copy = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+    make_transient_to_detached(copy)
+    return copy
+
+
+def cache_principal(token: str, payload: dict, user: User) -> None:
+    ttl = min(PRINCIPAL_CACHE_TTL, payload["exp"] - time.time())
+    if ttl > 0:
+        principal_cache.set(token, CachedPrincipal(_snapshot(user), payload.get("jti")), ttl=ttl)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    dropped = principal_cache.pop_where(lambda entry: entry.user.id == user_id)
+    if dropped:
+        logger.debug("Principal cache: dropped %d entries for user %s", dropped, user_id)
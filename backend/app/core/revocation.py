@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+
+from app.core.constants import (
+    REVOCATION_FILTER_CAPACITY,
+    REVOCATION_FULL_RELOAD_INTERVAL,
+    REVOCATION_SYNC_INTERVAL,
+    REVOCATION_SYNC_OVERLAP,
+)
+from app.core.database import async_session, async_session_read_primary, utcnow
+from app.models.revoked_token import RevokedToken
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Revoked access-token jtis, mirrored in memory from revoked_tokens.
+
+    The Bloom filter answers the common "not revoked" case; its rare positives
+    are confirmed against the exact set. Each sync reads only rows created
+    since the previous one; a periodic full reload drops expired entries.
+    Syncs read the primary: a lagging replica would hide fresh revocations
+    past the overlap window, and the cursor would then skip them for good.
+    """
+
+    def __init__(self, capacity: int = REVOCATION_FILTER_CAPACITY):
+        self._capacity = capacity
+        self._bloom = BloomFilter(capacity)
+        self._exact: dict[str, datetime] = {}
+        self._cursor: datetime | None = None
+        self._last_full_reload = 0.0  # monotonic
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        self._bloom.add(jti)
+        self._exact[jti] = expires_at
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._bloom and jti in self._exact
+
+    async def sync(self) -> None:
+        now = utcnow()
+        full = (
+            self._cursor is None
+            or len(self._exact) >= self._capacity
+            or time.monotonic() - self._last_full_reload >= REVOCATION_FULL_RELOAD_INTERVAL
+        )
+        query = select(RevokedToken.jti, RevokedToken.expires_at).where(
+            RevokedToken.expires_at > now
+        )
+        if not full:
+            # Overlap covers rows committed late with an earlier created_at
+            query = query.where(
+                RevokedToken.created_at > self._cursor - timedelta(seconds=REVOCATION_SYNC_OVERLAP)
+            )
+        async with async_session_read_primary() as db:
+            rows = (await db.execute(query)).all()
+
+        if full:
+            capacity = max(REVOCATION_FILTER_CAPACITY, 2 * len(rows))
+            bloom = BloomFilter(capacity)
+            exact = {}
+            for jti, expires_at in rows:
+                bloom.add(jti)
+                exact[jti] = expires_at
+            self._bloom, self._exact, self._capacity = bloom, exact, capacity
+            self._last_full_reload = time.monotonic()
+            await self._prune(now)
+        else:
+            for jti, expires_at in rows:
+                self.add(jti, expires_at)
+        self._cursor = now
+
+    async def _prune(self, now: datetime) -> None:
+        async with async_session() as db:
+            async with db.begin():
+                await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+
+    async def run_sync(self) -> None:
+        """Keep the mirror in sync until cancelled."""
+        while True:
+            await asyncio.sleep(REVOCATION_SYNC_INTERVAL)
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Revocation list sync failed")
+
+
+revocations = RevocationList()
@@ -1,26 +1,87 @@
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import bcrypt
 import jwt
 
 from app.core.config import settings
+from app.core.constants import PASSWORD_HASH_SLOW_QUEUE
 
 logger = logging.getLogger(__name__)
 
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+class PasswordHasherBusy(Exception):
+    """Too many password hashes are already running or queued."""
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# bcrypt releases the GIL, so a small thread pool keeps it off the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
+_hash_pending = 0
+_hash_stats = {
+    "completed": 0,
+    "rejected": 0,
+    "queue_seconds_total": 0.0,
+    "queue_seconds_max": 0.0,
+}
+
+
+def password_hash_stats() -> dict:
+    return {**_hash_stats, "pending": _hash_pending}
+
+
+async def _run_in_hash_pool(func, *args):
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        _hash_stats["rejected"] += 1
+        logger.warning("Password hash pool full (%d pending), rejecting", _hash_pending)
+        raise PasswordHasherBusy()
+
+    submitted = time.perf_counter()
+
+    def timed():
+        return time.perf_counter() - submitted, func(*args)
+
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        queued, result = await loop.run_in_executor(_hash_executor, timed)
+    finally:
+        _hash_pending -= 1
+
+    _hash_stats["completed"] += 1
+    _hash_stats["queue_seconds_total"] += queued
+    _hash_stats["queue_seconds_max"] = max(_hash_stats["queue_seconds_max"], queued)
+    if queued > PASSWORD_HASH_SLOW_QUEUE:
+        logger.warning("Password hash waited %.2fs in queue", queued)
+    return result
+
+
+def _hash_password_sync(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
 
-def create_access_token(user_id: UUID) -> str:
+async def hash_password(password: str) -> str:
+    return await _run_in_hash_pool(_hash_password_sync, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_hash_pool(_verify_password_sync, plain_password, hashed_password)
+
+
+def create_access_token(user_id: UUID, token_version: int = 0) -> str:
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
@@ -28,6 +89,8 @@ def create_access_token(user_id: UUID) -> str:
         "sub": str(user_id),
         "exp": expire,
         "type": "access",
+        "jti": uuid4().hex,
+        "ver": token_version,
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
@@ -0,0 +1,27 @@
+import logging
+from typing import NamedTuple
+from uuid import UUID
+
+from app.core.constants import WISHLIST_CACHE_MAX_SIZE, WISHLIST_CACHE_TTL
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class WishlistMeta(NamedTuple):
+    slug: str
+    user_id: UUID
+    is_archived: bool
+    is_deleted: bool
+
+
+# Slug and owner never change; the flags do, so entries live only for a short
+# TTL. Local writes invalidate immediately, other workers catch up on expiry.
+wishlist_cache: TTLCache[UUID, WishlistMeta] = TTLCache(
+    maxsize=WISHLIST_CACHE_MAX_SIZE, ttl=WISHLIST_CACHE_TTL
+)
+
+
+def invalidate_wishlist(wishlist_id: UUID) -> None:
+    wishlist_cache.pop(wishlist_id)
+    logger.debug("Wishlist cache invalidated: %s", wishlist_id)
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
@@ -11,7 +13,13 @@ from slowapi.errors import RateLimitExceeded
 
 from app.api.endpoints import auth, health, items, parse_url, public, reservations, upload, wishlists, ws
 from app.core.config import settings
+from app.core.constants import PASSWORD_HASH_RETRY_AFTER, READ_PRIMARY_HEADER
+from app.core.google_jwks import google_keys
+from app.core.http_client import close_http_client, get_http_client
 from app.core.limiter import limiter
+from app.core.revocation import revocations
+from app.core.security import PasswordHasherBusy
+from app.utils.image_mirror import run_collector
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,7 +27,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Vishlist API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await revocations.sync()
+    except Exception:
+        logger.exception("Initial revocation list sync failed")
+    background = [asyncio.create_task(revocations.run_sync()), asyncio.create_task(run_collector())]
+    if settings.GOOGLE_CLIENT_ID:
+        background.append(asyncio.create_task(google_keys.run_refresher()))
+    get_http_client()
+    yield
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await close_http_client()
+
+
+app = FastAPI(title="Vishlist API", version="1.0.0", lifespan=lifespan)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -35,7 +61,7 @@ app.add_middleware(
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-    allow_headers=["Authorization", "Content-Type", "X-Guest-Token"],
+    allow_headers=["Authorization", "Content-Type", "X-Guest-Token", READ_PRIMARY_HEADER],
     expose_headers=["X-Error-Code"],
 )
 
@@ -55,6 +81,15 @@ async def validation_exception_handler(
     )
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Сервер перегружен, попробуйте позже"},
+        headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)},
+    )
+
+
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled exception: %s", exc)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base, utcnow
@@ -21,5 +21,14 @@ class ItemContribution(Base):
 
     item: Mapped["WishlistItem"] = relationship(back_populates="contributions")
 
+    __table_args__ = (
+        Index(
+            "ix_item_contributions_guest_email_item",
+            "guest_email",
+            "item_id",
+            postgresql_where=text("guest_email IS NOT NULL"),
+        ),
+    )
+
 
 from app.models.item import WishlistItem  # noqa: E402, F401
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base, utcnow
+
+
+class MirroredImage(Base):
+    """Remote item image copied into UPLOAD_DIR (app.utils.image_mirror), one row per source URL."""
+
+    __tablename__ = "mirrored_images"
+
+    source_hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of the source URL
+    source_url: Mapped[str] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(String(16))  # done / failed
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str | None] = mapped_column(String(200))
+    retry_after: Mapped[datetime | None] = mapped_column()
+    created_at: Mapped[datetime] = mapped_column(default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base, utcnow
+
+
+class ParsedUrl(Base):
+    """Persistent tier of the URL parse cache (app.core.parse_cache)."""
+
+    __tablename__ = "parsed_urls"
+
+    url_hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of the canonical URL
+    url: Mapped[str] = mapped_column(Text)
+    data: Mapped[dict] = mapped_column(JSONB)
+    expires_at: Mapped[datetime] = mapped_column(index=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base, utcnow
@@ -20,5 +20,14 @@ class ItemReservation(Base):
 
     item: Mapped["WishlistItem"] = relationship(back_populates="reservation")
 
+    __table_args__ = (
+        Index(
+            "ix_item_reservations_guest_email_item",
+            "guest_email",
+            "item_id",
+            postgresql_where=text("guest_email IS NOT NULL"),
+        ),
+    )
+
 
 from app.models.item import WishlistItem  # noqa: E402, F401
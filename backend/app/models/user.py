@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String
+from sqlalchemy import String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base, utcnow
@@ -17,4 +17,6 @@ class User(Base):
     avatar_url: Mapped[str | None] = mapped_column(String(500))
     oauth_provider: Mapped[str | None] = mapped_column(String(50))
     oauth_id: Mapped[str | None] = mapped_column(String(255))
+    # Bumped by "log out everywhere"; tokens carrying an older "ver" are rejected
+    token_version: Mapped[int] = mapped_column(default=0, server_default=text("0"))
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base, utcnow
+
+
+class WbBasket(Base):
+    """Learned Wildberries CDN basket per product volume (app.utils.marketplaces.wb_baskets)."""
+
+    __tablename__ = "wb_baskets"
+
+    vol: Mapped[int] = mapped_column(primary_key=True)  # nm_id // 100000
+    basket: Mapped[int] = mapped_column(SmallInteger)
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, ForeignKey, String
+from sqlalchemy import Boolean, Date, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base, utcnow
@@ -24,5 +24,10 @@ class Wishlist(Base):
 
     items: Mapped[list["WishlistItem"]] = relationship(back_populates="wishlist", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Prefix (LIKE 'base-%') lookups for slug allocation
+        Index("ix_wishlists_slug_pattern", "slug", postgresql_ops={"slug": "varchar_pattern_ops"}),
+    )
+
 
 from app.models.item import WishlistItem  # noqa: E402, F401
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field
+from typing import Literal
+from uuid import UUID
 
-from app.core.constants import MAX_ITEM_NOTE_LENGTH, MAX_ITEM_TITLE_LENGTH
+from pydantic import BaseModel, Field, model_validator
+
+from app.core.constants import MAX_ITEM_NOTE_LENGTH, MAX_ITEM_TITLE_LENGTH, MAX_ITEMS_PER_WISHLIST
 
 
 class ItemCreate(BaseModel):
@@ -11,6 +14,10 @@ class ItemCreate(BaseModel):
     note: str | None = Field(None, max_length=MAX_ITEM_NOTE_LENGTH)
 
 
+class ItemBulkCreate(BaseModel):
+    items: list[ItemCreate] = Field(min_length=1, max_length=MAX_ITEMS_PER_WISHLIST)
+
+
 class ItemUpdate(BaseModel):
     title: str | None = Field(None, min_length=1, max_length=MAX_ITEM_TITLE_LENGTH)
     url: str | None = Field(None, max_length=2000)
@@ -37,6 +44,19 @@ class ItemResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ItemMove(BaseModel):
+    """New neighbours of a dragged item; None means top/bottom of the list."""
+
+    prev_id: UUID | None = None
+    next_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def check_neighbours(self) -> "ItemMove":
+        if self.prev_id is None and self.next_id is None:
+            raise ValueError("prev_id or next_id is required")
+        return self
+
+
 class ReorderItem(BaseModel):
     id: str
     position: int = Field(ge=0)
@@ -44,3 +64,15 @@ class ReorderItem(BaseModel):
 
 class ReorderRequest(BaseModel):
     items: list[ReorderItem]
+
+
+class ItemBulkAction(BaseModel):
+    action: Literal["delete", "restore", "move"]
+    item_ids: list[UUID] = Field(min_length=1, max_length=MAX_ITEMS_PER_WISHLIST)
+    target_wishlist_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def check_target(self) -> "ItemBulkAction":
+        if self.action == "move" and self.target_wishlist_id is None:
+            raise ValueError("target_wishlist_id is required for move")
+        return self
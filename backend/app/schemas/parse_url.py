@@ -0,0 +1,34 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from app.core.constants import URL_PARSER_BATCH_MAX_URLS
+
+
+class ParseUrlRequest(BaseModel):
+    url: str = Field(max_length=2000)
+
+
+class ParseUrlBatchRequest(BaseModel):
+    urls: list[Annotated[str, Field(max_length=2000)]] = Field(
+        min_length=1, max_length=URL_PARSER_BATCH_MAX_URLS
+    )
+
+
+class ParseUrlResponse(BaseModel):
+    title: str | None = None
+    image_url: str | None = None
+    description: str | None = None
+    price: int | None = None
+    price_source: str | None = None  # json-ld, meta, microdata, text, marketplace
+    price_confidence: float | None = None
+
+
+class ParseUrlBatchLine(BaseModel):
+    """One NDJSON line of a batch parse, sent as soon as that URL is done."""
+
+    index: int  # position in the request's urls
+    url: str
+    status: int  # HTTP status the single-URL endpoint would have returned
+    result: ParseUrlResponse | None = None
+    error: str | None = None
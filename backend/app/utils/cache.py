@@ -0,0 +1,81 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Process-local LRU cache with per-entry expiry.
+
+    Not shared between workers: keep TTLs short for anything that can change.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[V], bool]) -> int:
+        """Drop every entry whose value matches; returns how many were dropped."""
+        keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight(Generic[K, V]):
+    """Coalesce concurrent calls for the same key into one in-flight call.
+
+    The call runs as its own task, so a caller that goes away does not
+    cancel it for the others still waiting.
+    """
+
+    def __init__(self):
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def _done(self, key: K, task: asyncio.Task[V]) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved here even if every caller left
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+from lxml import etree
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_FEED_CHUNK = 4096  # small, so parsing stops soon after </head>
+
+_BODY_TAG_RE = re.compile(r"<body[\s>/]", re.IGNORECASE)
+
+_WANTED_META = {
+    "og:title", "og:image", "og:description",
+    "twitter:title", "twitter:image", "twitter:description",
+    "product:price:amount", "product:price:currency",
+    "og:price:amount", "og:price:currency",
+}
+
+# Parsing is CPU-bound; keep it off the event loop and bounded
+_parse_executor = ThreadPoolExecutor(
+    max_workers=settings.HTML_PARSE_WORKERS, thread_name_prefix="html-parse"
+)
+
+
+class HeadMeta(NamedTuple):
+    meta: dict[str, str]  # og:* / twitter:* -> content, first occurrence wins
+    title: str | None  # <title>
+    json_ld: list[dict[str, Any]]  # JSON-LD objects, @graph and lists flattened
+
+
+def flatten_json_ld(data: Any) -> list[dict[str, Any]]:
+    if isinstance(data, list):
+        return [obj for item in data for obj in flatten_json_ld(item)]
+    if not isinstance(data, dict):
+        return []
+    if "@graph" in data:
+        return flatten_json_ld(data["@graph"])
+    return [data]
+
+
+def json_ld_products(objects: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """The schema.org Product objects among flattened JSON-LD, in page order."""
+    for obj in objects:
+        types = obj.get("@type")
+        if types == "Product" or (isinstance(types, list) and "Product" in types):
+            yield obj
+
+
+def extract_head_meta(html: str) -> HeadMeta:
+    """Collect og:*, twitter:*, <title> and JSON-LD from the document head.
+
+    An event-driven lxml parse that stops at </head> (or the first body
+    element), so no tree is built for the rest of the page. A stray body
+    element in the head (tag-manager iframes, injected divs) makes lxml open
+    the body early; such an implied body is read up to the page's own
+    <body> tag.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"), recover=True, no_network=True)
+    body_tag = _BODY_TAG_RE.search(html)
+    body_at = body_tag.start() if body_tag else 0
+    meta: dict[str, str] = {}
+    title = None
+    json_ld: list[dict[str, Any]] = []
+    implied_body = False
+    done = False
+    # The <body> tag starts a chunk, so a body opened before it is implied
+    bounds = [*range(0, body_at, _FEED_CHUNK), *range(body_at, len(html), _FEED_CHUNK), len(html)]
+    for start, end in zip(bounds, bounds[1:]):
+        if implied_body and start >= body_at:
+            break
+        parser.feed(html[start:end])
+        real_body_fed = end > body_at
+        for event, el in parser.read_events():
+            tag = el.tag if isinstance(el.tag, str) else ""
+            if event == "start":
+                if tag == "body":
+                    if real_body_fed:
+                        done = True
+                        break
+                    implied_body = True
+                if tag == "meta":
+                    key = (el.get("property") or el.get("name") or "").lower()
+                    content = el.get("content")
+                    if key in _WANTED_META and content and key not in meta:
+                        meta[key] = content.strip()
+            elif tag == "head" and real_body_fed:
+                done = True
+                break
+            elif tag == "title" and title is None:
+                title = (el.text or "").strip() or None
+            elif tag == "script" and (el.get("type") or "").lower() == "application/ld+json":
+                try:
+                    json_ld.extend(flatten_json_ld(json.loads(el.text or "")))
+                except ValueError:
+                    pass
+        if done:
+            break
+    return HeadMeta(meta, title, json_ld)
+
+
+async def run_in_parse_pool(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_parse_executor, func, *args)
@@ -0,0 +1,276 @@
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+from PIL import ExifTags, Image, ImageOps
+from sqlalchemy import and_, delete, exists, func, or_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.constants import (
+    IMAGE_MIRROR_ATTEMPTS,
+    IMAGE_MIRROR_BACKOFF,
+    IMAGE_MIRROR_CONCURRENCY,
+    IMAGE_MIRROR_GC_GRACE,
+    IMAGE_MIRROR_GC_INTERVAL,
+    IMAGE_MIRROR_MAX_PIXELS,
+    IMAGE_MIRROR_QUALITY,
+    IMAGE_MIRROR_RETRY_AFTER,
+    IMAGE_MIRROR_WIDTH,
+    MAX_IMAGE_SIZE,
+)
+from app.core.database import async_session, utcnow
+from app.core.http_client import stream_pinned
+from app.models.item import WishlistItem
+from app.models.mirrored_image import MirroredImage
+from app.utils.cache import SingleFlight
+from app.utils.ssrf import BlockedHostError
+from app.utils.tasks import spawn_after_commit
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+
+DONE = "done"
+FAILED = "failed"
+
+_SOURCE_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+_ROTATED = {5, 6, 7, 8}  # EXIF orientations that swap width and height
+
+_flights: SingleFlight[str, str | None] = SingleFlight()
+_downloads = asyncio.Semaphore(IMAGE_MIRROR_CONCURRENCY)
+
+
+class _Rejected(Exception):
+    """The source can't be mirrored, and retrying now won't change that."""
+
+
+class _Transient(Exception):
+    """The upstream had a bad moment (5xx/429); worth another attempt."""
+
+
+def _uploads_prefix() -> str:
+    return f"{settings.BASE_URL.rstrip('/')}/api/uploads/"
+
+
+_SUFFIX = f"-{IMAGE_MIRROR_WIDTH}.webp"
+
+
+def _file_name(key: str) -> str:
+    return key[:32] + _SUFFIX
+
+
+def _local_url(key: str) -> str:
+    return _uploads_prefix() + _file_name(key)
+
+
+def needs_mirror(url: str | None) -> bool:
+    return bool(url) and url.startswith(("http://", "https://")) and not url.startswith(_uploads_prefix())
+
+
+def schedule_mirror(db: AsyncSession, items: list[tuple[uuid.UUID, str | None]]) -> None:
+    """Mirror the remote images of (item id, image_url) pairs after the request commits."""
+    pending = [(item_id, url) for item_id, url in items if needs_mirror(url)]
+    if pending:
+        spawn_after_commit(db, lambda: mirror_item_images(pending), name="image-mirror")
+
+
+async def mirror_item_images(items: list[tuple[uuid.UUID, str]]) -> None:
+    by_source: dict[str, list[uuid.UUID]] = defaultdict(list)
+    for item_id, url in items:
+        by_source[url].append(item_id)
+    await asyncio.gather(*(_mirror_and_point(url, ids) for url, ids in by_source.items()))
+
+
+async def _mirror_and_point(source: str, item_ids: list[uuid.UUID]) -> None:
+    key = hashlib.sha256(source.encode()).hexdigest()
+    local = await _flights.do(key, lambda: _mirror(key, source))
+    if local is None:
+        return
+    async with async_session() as db:
+        async with db.begin():
+            # Only items still showing this source: the owner may have changed it meanwhile
+            await db.execute(
+                update(WishlistItem)
+                .where(WishlistItem.id.in_(item_ids), WishlistItem.image_url == source)
+                .values(image_url=local, updated_at=WishlistItem.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+
+
+async def _mirror(key: str, source: str) -> str | None:
+    """Local URL of the copy, downloading the source unless known."""
+    async with async_session() as db:
+        known = await db.get(MirroredImage, key)
+        if known is not None and known.status == DONE:
+            # Marks the copy as in use; no row means the collector just removed it
+            touched = await db.execute(
+                update(MirroredImage)
+                .where(MirroredImage.source_hash == key, MirroredImage.status == DONE)
+                .values(updated_at=utcnow())
+            )
+            await db.commit()
+            if touched.rowcount:
+                return _local_url(key)
+        elif known is not None and known.retry_after and known.retry_after > utcnow():
+            return None
+
+    error = ""
+    for attempt in range(IMAGE_MIRROR_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(IMAGE_MIRROR_BACKOFF * 2 ** (attempt - 1))
+        try:
+            async with _downloads:
+                data = await _download(source)
+            webp = await asyncio.to_thread(_render, data)
+            await asyncio.to_thread(_write, key, webp)
+        except _Rejected as exc:
+            error = str(exc)
+            break
+        except (_Transient, httpx.TransportError) as exc:
+            error = str(exc) or type(exc).__name__
+            continue
+        await _record(key, source, DONE)
+        return _local_url(key)
+
+    logger.info("Image mirror failed for %s: %s", source, error)
+    await _record(key, source, FAILED, error)
+    return None
+
+
+async def _download(source: str) -> bytes:
+    try:
+        async with stream_pinned(source, headers={"Accept": "image/webp,image/*;q=0.8"}) as response:
+            if response.status_code >= 500 or response.status_code == 429:
+                raise _Transient(f"HTTP {response.status_code}")
+            if response.status_code != 200:
+                raise _Rejected(f"HTTP {response.status_code}")
+            if not response.headers.get("content-type", "").startswith("image/"):
+                raise _Rejected("not an image")
+            content_length = response.headers.get("content-length")
+            if content_length and int(content_length) > MAX_IMAGE_SIZE:
+                raise _Rejected("too large")
+            data = bytearray()
+            async for chunk in response.aiter_bytes():
+                data += chunk
+                if len(data) > MAX_IMAGE_SIZE:
+                    raise _Rejected("too large")
+            return bytes(data)
+    except (BlockedHostError, httpx.TooManyRedirects):
+        raise _Rejected("blocked address") from None
+
+
+def _render(data: bytes) -> bytes:
+    """WebP copy at most IMAGE_MIRROR_WIDTH wide (runs in a worker thread)."""
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.format not in _SOURCE_FORMATS:
+                raise _Rejected(f"unsupported format {img.format}")
+            if img.width * img.height > IMAGE_MIRROR_MAX_PIXELS:
+                raise _Rejected("too many pixels")
+            width = IMAGE_MIRROR_WIDTH
+            # JPEG can decode straight at a reduced scale, much cheaper for big
+            # photos. The box is in stored pixels, so a photo rotated by EXIF
+            # needs its stored height to stay at least ``width``.
+            if img.getexif().get(ExifTags.Base.Orientation) in _ROTATED:
+                img.draft("RGB", (max(1, img.width * width // img.height), width))
+            else:
+                img.draft("RGB", (width, max(1, img.height * width // img.width)))
+            img = ImageOps.exif_transpose(img)
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+    except (Image.UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        raise _Rejected(f"undecodable: {exc}") from None
+
+    if img.width > width:
+        img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=IMAGE_MIRROR_QUALITY, method=4)
+    return buf.getvalue()
+
+
+def _remove(keys: list[str]) -> None:
+    for key in keys:
+        (UPLOAD_DIR / _file_name(key)).unlink(missing_ok=True)
+
+
+def _write(key: str, data: bytes) -> None:
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    path = UPLOAD_DIR / _file_name(key)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)  # readers never see a half-written file
+
+
+async def _record(key: str, source: str, status: str, error: str | None = None) -> None:
+    now = utcnow()
+    values = {
+        "source_hash": key,
+        "source_url": source,
+        "status": status,
+        "attempts": 1,
+        "last_error": error[:200] if error else None,
+        "retry_after": now + timedelta(seconds=IMAGE_MIRROR_RETRY_AFTER) if status == FAILED else None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    stmt = insert(MirroredImage).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MirroredImage.source_hash],
+        set_={
+            "status": stmt.excluded.status,
+            "attempts": MirroredImage.attempts + 1,
+            "last_error": stmt.excluded.last_error,
+            "retry_after": stmt.excluded.retry_after,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    async with async_session() as db:
+        async with db.begin():
+            await db.execute(stmt)
+
+
+async def collect_unused() -> int:
+    """Delete copies no item has pointed at for IMAGE_MIRROR_GC_GRACE, and old failures.
+
+    Items are matched on the file name alone, so a changed BASE_URL can't
+    make every copy look unused. Files go while the rows are still locked:
+    a concurrent _mirror touching the row waits, then finds it gone and
+    downloads afresh.
+    """
+    name = func.concat(func.substr(MirroredImage.source_hash, 1, 32), _SUFFIX)
+    in_use = exists().where(func.right(WishlistItem.image_url, 32 + len(_SUFFIX)) == name)
+    stmt = (
+        delete(MirroredImage)
+        .where(
+            MirroredImage.updated_at < utcnow() - timedelta(seconds=IMAGE_MIRROR_GC_GRACE),
+            or_(MirroredImage.status == FAILED, and_(MirroredImage.status == DONE, ~in_use)),
+        )
+        .returning(MirroredImage.source_hash, MirroredImage.status)
+    )
+    async with async_session() as db:
+        async with db.begin():
+            rows = (await db.execute(stmt)).all()
+            await asyncio.to_thread(_remove, [key for key, status in rows if status == DONE])
+    return len(rows)
+
+
+async def run_collector() -> None:
+    """Sweep unused copies until cancelled."""
+    while True:
+        await asyncio.sleep(IMAGE_MIRROR_GC_INTERVAL)
+        try:
+            removed = await collect_unused()
+        except Exception:
+            logger.exception("Mirrored image cleanup failed")
+        else:
+            if removed:
+                logger.info("Removed %d unused mirrored images", removed)
@@ -0,0 +1,23 @@
+from app.utils.marketplaces.aliexpress import AliExpressAdapter
+from app.utils.marketplaces.base import AdapterRegistry, MarketplaceAdapter
+from app.utils.marketplaces.lamoda import LamodaAdapter
+from app.utils.marketplaces.ozon import OzonAdapter
+from app.utils.marketplaces.wildberries import WildberriesAdapter
+from app.utils.marketplaces.yandex_market import YandexMarketAdapter
+
+registry = AdapterRegistry()
+for _adapter in (
+    WildberriesAdapter(),
+    OzonAdapter(),
+    YandexMarketAdapter(),
+    AliExpressAdapter(),
+    LamodaAdapter(),
+):
+    registry.register(_adapter)
+
+
+def find_adapter(host: str) -> MarketplaceAdapter | None:
+    return registry.find(host)
+
+
+__all__ = ["MarketplaceAdapter", "find_adapter", "registry"]
@@ -0,0 +1,23 @@
+import re
+from urllib.parse import urlparse
+
+from app.utils.marketplaces.base import MarketplaceAdapter
+from app.utils.url import strip_params
+
+_ITEM_ID = re.compile(r"/item/(\d+)\.html")
+
+
+class AliExpressAdapter(MarketplaceAdapter):
+    """Collapses item links to one URL per product; the page itself has og: tags."""
+
+    name = "aliexpress"
+    domains = ("aliexpress.ru", "aliexpress.com")
+
+    async def resolve(self, url: str) -> str:
+        parsed = urlparse(url)
+        match = _ITEM_ID.search(parsed.path)
+        if not match:
+            return strip_params(url, {"spm"})
+        # m./www./de. mirrors all serve the same item under the bare domain
+        host = "aliexpress.ru" if (parsed.hostname or "").endswith(".ru") else "aliexpress.com"
+        return f"https://{host}/item/{match.group(1)}.html"
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+
+from app.core.constants import MARKETPLACE_DEFAULT_CONCURRENCY, URL_PARSER_TIMEOUT
+from app.schemas.parse_url import ParseUrlResponse
+
+logger = logging.getLogger(__name__)
+
+
+def title_from_slug(slug: str, drop_prefix: int = 0, strip_id: bool = True) -> str | None:
+    """Readable title from a URL slug: "tapochki-domashnie-2748295341" → "Tapochki domashnie"."""
+    words = [w for w in slug.split("-") if w]
+    # Trailing numeric ID carries no meaning for the user
+    if strip_id and len(words) > 1 and words[-1].isdigit():
+        words = words[:-1]
+    words = words[drop_prefix:]
+    title = " ".join(words).strip().capitalize()
+    if len(title) < 3:
+        return None
+    return title[:200]
+
+
+class MarketplaceAdapter:
+    """Site-specific fast path for the URL parser.
+
+    Subclasses override any of the hooks below; every call through
+    ``canonical``/``parse`` runs under the adapter's own concurrency
+    limit and timeout, so a slow marketplace can't stall the others.
+    """
+
+    name: str = ""
+    domains: tuple[str, ...] = ()
+    timeout: float = URL_PARSER_TIMEOUT
+    max_concurrency: int = MARKETPLACE_DEFAULT_CONCURRENCY
+
+    def __init__(self) -> None:
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def resolve(self, url: str) -> str:
+        """Canonical product URL (short links expanded, variant noise dropped)."""
+        return url
+
+    async def fetch(self, url: str) -> ParseUrlResponse | None:
+        """Product data without loading the HTML page; None defers to the generic parser."""
+        return None
+
+    def fallback(self, url: str) -> ParseUrlResponse | None:
+        """Best-effort result from the URL alone when the page fetch failed."""
+        return None
+
+    async def canonical(self, url: str) -> str:
+        try:
+            async with self._slots, asyncio.timeout(self.timeout):
+                return await self.resolve(url)
+        except TimeoutError:
+            logger.debug("%s: resolve timed out for %s", self.name, url)
+            return url
+
+    async def parse(self, url: str) -> ParseUrlResponse | None:
+        try:
+            async with self._slots, asyncio.timeout(self.timeout):
+                return await self.fetch(url)
+        except TimeoutError:
+            logger.debug("%s: fast path timed out for %s", self.name, url)
+            return None
+
+
+class AdapterRegistry:
+    """Host → adapter lookup via a trie of reversed domain labels.
+
+    "market.yandex.ru" is stored as ru → yandex → market, so a lookup walks
+    the host from the TLD and the deepest registered suffix wins. Matching
+    is on label boundaries: "notozon.ru" does not hit "ozon.ru".
+    """
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+        self._adapters: list[MarketplaceAdapter] = []
+
+    def register(self, adapter: MarketplaceAdapter) -> None:
+        for domain in adapter.domains:
+            node = self._root
+            for label in reversed(domain.lower().split(".")):
+                node = node.setdefault(label, {})
+            node[None] = adapter
+        self._adapters.append(adapter)
+
+    def find(self, host: str) -> MarketplaceAdapter | None:
+        node = self._root
+        found = None
+        for label in reversed(host.lower().rstrip(".").split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+    def __iter__(self):
+        return iter(self._adapters)
+
@@ -0,0 +1,31 @@
+import re
+from urllib.parse import urlparse
+
+from app.schemas.parse_url import ParseUrlResponse
+from app.utils.marketplaces.base import MarketplaceAdapter, title_from_slug
+
+# /p/mp002xw0v5ny/clothes-mango-plate/ — the slug starts with the category
+_PRODUCT_PATH = re.compile(r"/p/(\w+)(?:/([\w-]+))?")
+
+
+class LamodaAdapter(MarketplaceAdapter):
+    """Generic HTML parse on a canonical URL, slug title if the page fails."""
+
+    name = "lamoda"
+    domains = ("lamoda.ru",)
+
+    async def resolve(self, url: str) -> str:
+        match = _PRODUCT_PATH.match(urlparse(url).path)
+        if not match:
+            return url
+        sku, slug = match.group(1).lower(), match.group(2)
+        return f"https://www.lamoda.ru/p/{sku}/{slug}/" if slug else f"https://www.lamoda.ru/p/{sku}/"
+
+    def fallback(self, url: str) -> ParseUrlResponse | None:
+        match = _PRODUCT_PATH.match(urlparse(url).path)
+        if not match or not match.group(2):
+            return None
+        title = title_from_slug(match.group(2), drop_prefix=1, strip_id=False)
+        if not title:
+            return None
+        return ParseUrlResponse(title=title, image_url=None, description=None, price=None)
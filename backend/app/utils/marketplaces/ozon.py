@@ -0,0 +1,57 @@
+import logging
+import re
+from urllib.parse import urlparse
+
+from app.core.constants import PARSE_CACHE_MAX_SIZE, PARSE_CACHE_TTL
+from app.core.http_client import http_get
+from app.schemas.parse_url import ParseUrlResponse
+from app.utils.cache import TTLCache
+from app.utils.marketplaces.base import MarketplaceAdapter, title_from_slug
+from app.utils.url import strip_params
+
+logger = logging.getLogger(__name__)
+
+_SHORT_LINK = re.compile(r"/t/\w+")
+_PRODUCT_SLUG = re.compile(r"/product/(.+?)(?:/|\?|$)")
+
+# Search/ad attribution Ozon appends to product links
+_TRACKING_PARAMS = {
+    "asb", "asb2", "avtc", "avte", "avts", "keywords", "sh", "__rr", "abt_att", "from",
+}
+
+# ozon.ru/t/... short link -> full product URL
+_short_links: TTLCache[str, str] = TTLCache(maxsize=PARSE_CACHE_MAX_SIZE, ttl=PARSE_CACHE_TTL)
+
+
+class OzonAdapter(MarketplaceAdapter):
+    """Title from the product slug (HTML fetch is blocked by anti-bot)."""
+
+    name = "ozon"
+    domains = ("ozon.ru",)
+
+    async def resolve(self, url: str) -> str:
+        return strip_params(await self._expand(url), _TRACKING_PARAMS)
+
+    async def _expand(self, url: str) -> str:
+        if not _SHORT_LINK.match(urlparse(url).path):
+            return url
+        resolved = _short_links.get(url)
+        if resolved is not None:
+            return resolved
+        try:
+            resp = await http_get(url, follow_redirects=False)
+            if resp.status_code in (301, 302, 307, 308):
+                location = resp.headers.get("location", "")
+                if "/product/" in location:
+                    _short_links.set(url, location)
+                    return location
+        except Exception:
+            logger.debug("Ozon short link resolve failed for %s", url)
+        return url
+
+    async def fetch(self, url: str) -> ParseUrlResponse | None:
+        match = _PRODUCT_SLUG.search(url)
+        title = title_from_slug(match.group(1)) if match else None
+        if not title:
+            return None
+        return ParseUrlResponse(title=title, image_url=None, description=None, price=None)
@@ -0,0 +1,187 @@
+import asyncio
+import bisect
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.constants import (
+    WB_BASKET_PROBE_SPAN,
+    WB_BASKET_PROBE_TIMEOUT,
+    WB_BASKET_REPROBE_INTERVAL,
+    WB_BASKET_VOLS_PER_BASKET,
+)
+from app.core.database import async_session, async_session_read, utcnow
+from app.core.http_client import http_get
+from app.models.wb_basket import WbBasket
+from app.utils.cache import SingleFlight, TTLCache
+from app.utils.tasks import spawn
+
+logger = logging.getLogger(__name__)
+
+# Each product lives on basket-NN.wbbasket.ru picked by its volume
+# (nm_id // 100000), and WB keeps adding baskets. Volumes past this table
+# (or whose guess stops serving cards) are probed on every plausible basket
+# at once; the answer is kept in memory and in wb_baskets for other workers.
+# Upper volume bound -> basket
+_STATIC_BASKETS = [
+    (143, 1), (287, 2), (431, 3), (719, 4),
+    (1007, 5), (1061, 6), (1115, 7), (1169, 8),
+    (1313, 9), (1601, 10), (1655, 11), (1919, 12),
+    (2045, 13), (2189, 14), (2405, 15), (2621, 16),
+    (2837, 17), (3053, 18), (3269, 19), (3485, 20),
+]
+_STATIC_MAX_VOL = _STATIC_BASKETS[-1][0]
+
+_learned: dict[int, int] = {}  # vol -> basket
+_vols: list[int] = []  # sorted keys of _learned
+_loaded = False
+_load_lock = asyncio.Lock()
+_probes: SingleFlight[int, int | None] = SingleFlight()
+_probed: TTLCache[int, bool] = TTLCache(maxsize=1024, ttl=WB_BASKET_REPROBE_INTERVAL)
+
+
+def _static_basket(vol: int) -> int | None:
+    for limit, basket in _STATIC_BASKETS:
+        if vol <= limit:
+            return basket
+    return None
+
+
+def cdn_base(nm_id: int, basket: int) -> str:
+    vol = nm_id // 100000
+    part = nm_id // 1000
+    return f"https://basket-{basket:02d}.wbbasket.ru/vol{vol}/part{part}/{nm_id}"
+
+
+def _remember(vol: int, basket: int) -> None:
+    if vol not in _learned:
+        bisect.insort(_vols, vol)
+    _learned[vol] = basket
+
+
+def _neighbours(vol: int) -> tuple[int | None, int | None]:
+    """Baskets of the nearest learned volumes below and above ``vol``."""
+    i = bisect.bisect_left(_vols, vol)
+    lower = _learned[_vols[i - 1]] if i > 0 else None
+    upper = _learned[_vols[i]] if i < len(_vols) else None
+    return lower, upper
+
+
+def _known_basket(vol: int) -> int | None:
+    if vol in _learned:
+        return _learned[vol]
+    # Baskets only grow with volume: equal neighbours pin everything between
+    lower, upper = _neighbours(vol)
+    if lower is not None and lower == upper:
+        return lower
+    return None
+
+
+def _guess(vol: int) -> int:
+    """Static table, or extrapolation from the last volume known beyond it."""
+    basket = _static_basket(vol)
+    if basket is not None:
+        return basket
+    anchor_vol, anchor_basket = _STATIC_MAX_VOL, _STATIC_BASKETS[-1][1]
+    i = bisect.bisect_left(_vols, vol)
+    if i > 0 and _vols[i - 1] > anchor_vol:
+        anchor_vol, anchor_basket = _vols[i - 1], _learned[_vols[i - 1]]
+    return anchor_basket + -(-(vol - anchor_vol) // WB_BASKET_VOLS_PER_BASKET)
+
+
+def _candidates(vol: int) -> list[int]:
+    """Baskets worth probing for ``vol``, most likely first."""
+    lower, upper = _neighbours(vol)
+    low = lower or 1
+    high = upper if upper is not None else _guess(vol) + WB_BASKET_PROBE_SPAN
+    center = min(max(_guess(vol), low), high)
+    window = range(max(center - WB_BASKET_PROBE_SPAN, low), min(center + WB_BASKET_PROBE_SPAN, high) + 1)
+    return sorted(window, key=lambda b: abs(b - center))
+
+
+async def _ensure_loaded() -> None:
+    global _loaded
+    if _loaded:
+        return
+    async with _load_lock:
+        if _loaded:
+            return
+        try:
+            async with async_session_read() as db:
+                rows = (await db.execute(select(WbBasket.vol, WbBasket.basket))).all()
+        except Exception:
+            logger.exception("Loading learned WB baskets failed")
+            return  # retried on the next parse
+        for vol, basket in rows:
+            _remember(vol, basket)
+        _loaded = True
+
+
+async def _serves_card(nm_id: int, basket: int) -> bool:
+    try:
+        resp = await http_get(f"{cdn_base(nm_id, basket)}/info/ru/card.json")
+    except Exception:
+        return False
+    return resp.status_code == 200
+
+
+async def _probe(vol: int, nm_id: int) -> int | None:
+    """Ask every candidate basket for the card at once; first 200 wins."""
+    _probed.set(vol, True)
+    probes = {
+        asyncio.create_task(_serves_card(nm_id, basket)): basket
+        for basket in _candidates(vol)
+    }
+    pending = set(probes)
+    try:
+        async with asyncio.timeout(WB_BASKET_PROBE_TIMEOUT):
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result():
+                        basket = probes[task]
+                        _remember(vol, basket)
+                        spawn(_store(vol, basket), name="wb-basket-store")
+                        return basket
+    except TimeoutError:
+        logger.debug("WB basket probe timed out for vol %s", vol)
+    finally:
+        for task in pending:
+            task.cancel()
+    return None
+
+
+async def _store(vol: int, basket: int) -> None:
+    stmt = insert(WbBasket).values(vol=vol, basket=basket, updated_at=utcnow())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[WbBasket.vol],
+        set_={"basket": stmt.excluded.basket, "updated_at": stmt.excluded.updated_at},
+    )
+    async with async_session() as db:
+        async with db.begin():
+            await db.execute(stmt)
+
+
+async def basket_for(nm_id: int) -> int:
+    """Basket serving ``nm_id``: learned, then the static table, then a probe."""
+    vol = nm_id // 100000
+    await _ensure_loaded()
+    basket = _known_basket(vol)
+    if basket is not None:
+        return basket
+    if vol <= _STATIC_MAX_VOL or _probed.get(vol):
+        return _guess(vol)
+    probed = await _probes.do(vol, lambda: _probe(vol, nm_id))
+    return probed if probed is not None else _guess(vol)
+
+
+async def relearn(nm_id: int, failed: int) -> int | None:
+    """Re-probe after ``failed`` stopped serving the card; a different basket or None."""
+    vol = nm_id // 100000
+    if _learned.get(vol, failed) != failed:
+        return _learned[vol]  # a concurrent probe already moved it
+    if _probed.get(vol):
+        return None
+    basket = await _probes.do(vol, lambda: _probe(vol, nm_id))
+    return basket if basket != failed else None
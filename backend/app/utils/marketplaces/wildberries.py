@@ -0,0 +1,144 @@
+import asyncio
+import json
+import logging
+import re
+
+import httpx
+
+from app.core.constants import HTTP_HEDGE_DELAY, WB_PRICE_DEADLINE
+from app.core.http_client import http_get
+from app.schemas.parse_url import ParseUrlResponse
+from app.utils.marketplaces import wb_baskets
+from app.utils.marketplaces.base import MarketplaceAdapter
+from app.utils.price import PriceInfo, price_fields
+from app.utils.url import strip_params
+
+logger = logging.getLogger(__name__)
+
+
+async def _until(deadline: float, request):
+    async with asyncio.timeout_at(deadline):
+        return await request
+
+
+async def _wb_search_price(nm_id: int, deadline: float) -> int | None:
+    """Fallback: get price from WB search API when CDN price-history is unavailable."""
+    try:
+        resp = await _until(
+            deadline,
+            http_get(
+                "https://search.wb.ru/exactmatch/ru/common/v9/search",
+                params={
+                    "appType": 1,
+                    "curr": "rub",
+                    "dest": -1257786,
+                    "query": str(nm_id),
+                    "resultset": "catalog",
+                },
+                headers={
+                    "Origin": "https://www.wildberries.ru",
+                    "Referer": "https://www.wildberries.ru/",
+                },
+            ),
+        )
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        products = data.get("data", {}).get("products", [])
+        for p in products:
+            if p.get("id") == nm_id:
+                # salePriceU is in hundredths of kopecks (e.g. 332300 = 3323 RUB)
+                sale = p.get("salePriceU")
+                if sale and isinstance(sale, int):
+                    return sale // 100
+        return None
+    except Exception:
+        logger.debug("WB search API fallback failed for %s", nm_id)
+        return None
+
+
+async def _fetch_card(
+    nm_id: int, basket: int, price_deadline: float
+) -> tuple[bool, str | None, int | None]:
+    """(card missing from this basket, title, price) from the basket CDN.
+
+    The price history is given up on at ``price_deadline``; the card is not.
+    """
+    base = wb_baskets.cdn_base(nm_id, basket)
+    missing = False
+    title = None
+    price = None
+
+    try:
+        card_resp, price_resp = await asyncio.gather(
+            http_get(f"{base}/info/ru/card.json", hedge_after=HTTP_HEDGE_DELAY),
+            _until(price_deadline, http_get(f"{base}/info/price-history.json", hedge_after=HTTP_HEDGE_DELAY)),
+            return_exceptions=True,
+        )
+
+        if isinstance(card_resp, httpx.Response) and card_resp.status_code == 404:
+            missing = True
+        if isinstance(card_resp, httpx.Response) and card_resp.status_code == 200:
+            try:
+                data = json.JSONDecoder().raw_decode(card_resp.text)[0]
+                title = data.get("imt_name")
+                if title and len(title) > 200:
+                    title = title[:200]
+            except (json.JSONDecodeError, IndexError):
+                pass
+
+        if isinstance(price_resp, httpx.Response) and price_resp.status_code == 200:
+            try:
+                history = price_resp.json()
+                if history and isinstance(history, list):
+                    rub_kopecks = history[-1].get("price", {}).get("RUB")
+                    if rub_kopecks and isinstance(rub_kopecks, int):
+                        price = rub_kopecks // 100
+            except (json.JSONDecodeError, KeyError, IndexError):
+                pass
+    except Exception:
+        logger.debug("WB CDN fetch failed for %s", nm_id)
+
+    return missing, title, price
+
+
+class WildberriesAdapter(MarketplaceAdapter):
+    """Card and price history straight from the public basket CDN."""
+
+    name = "wildberries"
+    domains = ("wildberries.ru", "wb.ru")
+    max_concurrency = 8
+
+    async def resolve(self, url: str) -> str:
+        # targetUrl records which listing the click came from
+        return strip_params(url, {"targeturl"})
+
+    async def fetch(self, url: str) -> ParseUrlResponse | None:
+        match = re.search(r"/catalog/(\d+)", url)
+        if not match:
+            return None
+
+        nm_id = int(match.group(1))
+        # A slow price source must not cost us the card: past this point
+        # we answer with the title and image alone
+        price_deadline = asyncio.get_running_loop().time() + WB_PRICE_DEADLINE
+        basket = await wb_baskets.basket_for(nm_id)
+        missing, title, price = await _fetch_card(nm_id, basket, price_deadline)
+        if missing:
+            # The basket table may be stale for this volume: find the real one
+            moved = await wb_baskets.relearn(nm_id, basket)
+            if moved is not None:
+                basket = moved
+                _, title, price = await _fetch_card(nm_id, basket, price_deadline)
+
+        # Fallback: try search API if CDN didn't return price. Its circuit
+        # may be open, in which case we answer with the title alone.
+        if price is None:
+            price = await _wb_search_price(nm_id, price_deadline)
+
+        return ParseUrlResponse(
+            title=title,
+            image_url=f"{wb_baskets.cdn_base(nm_id, basket)}/images/big/1.webp",
+            description=None,
+            **price_fields(PriceInfo(price, "marketplace") if price else None),
+        )
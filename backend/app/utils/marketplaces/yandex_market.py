@@ -0,0 +1,32 @@
+import re
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from app.schemas.parse_url import ParseUrlResponse
+from app.utils.marketplaces.base import MarketplaceAdapter, title_from_slug
+
+# /product--smartfon-apple-iphone-15/1234567 or /card/smartfon-apple-iphone-15/1234567
+_PRODUCT_PATH = re.compile(r"/(?:product--|card/)([\w-]+)/(\d+)")
+
+
+class YandexMarketAdapter(MarketplaceAdapter):
+    """Title from the product slug; the HTML page is behind a captcha."""
+
+    name = "yandex_market"
+    domains = ("market.yandex.ru",)
+
+    async def resolve(self, url: str) -> str:
+        parsed = urlparse(url)
+        match = _PRODUCT_PATH.search(parsed.path)
+        if not match:
+            return url
+        # Only ``sku`` picks a different offer; the rest is tracking/UI state
+        query = urlencode([(k, v) for k, v in parse_qsl(parsed.query) if k == "sku"])
+        path = f"/product--{match.group(1)}/{match.group(2)}"
+        return parsed._replace(netloc="market.yandex.ru", path=path, query=query).geturl()
+
+    async def fetch(self, url: str) -> ParseUrlResponse | None:
+        match = _PRODUCT_PATH.search(urlparse(url).path)
+        title = title_from_slug(match.group(1), strip_id=False) if match else None
+        if not title:
+            return None
+        return ParseUrlResponse(title=title, image_url=None, description=None, price=None)
@@ -0,0 +1,171 @@
+import json
+import re
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from app.utils.html_meta import HeadMeta, flatten_json_ld, json_ld_products
+
+MIN_PRICE = 1
+MAX_PRICE = 10_000_000
+
+# Sources in order of preference, with how far each is trusted
+PRICE_CONFIDENCE = {
+    "marketplace": 0.95,  # marketplace's own product API
+    "json-ld": 0.9,  # schema.org Product/Offer
+    "meta": 0.85,  # product:price:amount / og:price:amount
+    "microdata": 0.8,  # itemprop="price"
+    "text": 0.4,  # "12 990 ₽" somewhere in the page
+}
+
+_RUB = {"RUB", "RUR"}
+
+_LD_JSON_SCRIPT = re.compile(
+    r"""<script[^>]*application/ld\+json[^>]*>(.*?)</script\s*>""", re.IGNORECASE | re.DOTALL
+)
+_ITEMPROP_PRICE = re.compile(
+    r"""<[^>]*\bitemprop\s*=\s*["']?price\b["']?[^>]*>([^<]{0,64})""", re.IGNORECASE
+)
+_CONTENT_ATTR = re.compile(r"""\bcontent\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+# Digits with spaces, "." or "," between them: "12 990", "1.990", "1 990,00"
+_AMOUNT = re.compile(r"\d(?:[\d \xa0\u2009\u202f]|[.,](?=\d))*")
+_MARKS = re.compile(r"[.,]")
+# "25 000 ₽", "25000 руб", "от 1 990 рублей"
+_TEXT_PRICE = re.compile(rf"({_AMOUNT.pattern})\s*(?:₽|руб|рублей|RUB)", re.IGNORECASE)
+# Thousands separators: space, no-break, thin and narrow no-break space
+_SEPARATORS = str.maketrans("", "", " \xa0\u2009\u202f")
+
+
+class PriceInfo(NamedTuple):
+    amount: int  # whole rubles
+    source: str  # key of PRICE_CONFIDENCE
+
+    @property
+    def confidence(self) -> float:
+        return PRICE_CONFIDENCE[self.source]
+
+
+def price_fields(price: PriceInfo | None) -> dict:
+    """ParseUrlResponse price/price_source/price_confidence kwargs."""
+    if price is None:
+        return {}
+    return {
+        "price": price.amount,
+        "price_source": price.source,
+        "price_confidence": price.confidence,
+    }
+
+
+def _decimal(text: str) -> Decimal | None:
+    match = _AMOUNT.search(text)
+    if not match:
+        return None
+    *groups, last = _MARKS.split(match.group(0).translate(_SEPARATORS))
+    if any(len(group) != 3 for group in groups[1:]):
+        return None  # "12.05.2024" and the like
+    # A mark before exactly three digits groups thousands ("1,990", "1.990");
+    # otherwise the last one starts the kopecks ("12,99", "1.990,50")
+    if not groups or (len(last) == 3 and groups[0] != "0"):
+        return Decimal("".join(groups) + last)
+    return Decimal(f"{''.join(groups)}.{last}")
+
+
+def parse_amount(value: Any) -> int | None:
+    """Whole rubles from a number or a string like "1 990,00"; None if out of range."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        amount = Decimal(str(value))
+    elif isinstance(value, str):
+        amount = _decimal(value)
+        if amount is None:
+            return None
+    else:
+        return None
+    rubles = int(amount.to_integral_value())
+    return rubles if MIN_PRICE <= rubles <= MAX_PRICE else None
+
+
+def _offer_price(offers: Any) -> int | None:
+    for offer in offers if isinstance(offers, list) else [offers]:
+        if not isinstance(offer, dict):
+            continue
+        currency = offer.get("priceCurrency")
+        if currency and str(currency).upper() not in _RUB:
+            continue
+        price = offer.get("price")
+        if price is None:
+            price = offer.get("lowPrice")  # AggregateOffer
+        if price is None and isinstance(offer.get("priceSpecification"), dict):
+            price = offer["priceSpecification"].get("price")
+        amount = parse_amount(price)
+        if amount is not None:
+            return amount
+    return None
+
+
+def _json_ld_price(objects: list[dict]) -> int | None:
+    for product in json_ld_products(objects):
+        amount = _offer_price(product.get("offers"))
+        if amount is not None:
+            return amount
+    return None
+
+
+def _body_json_ld(html: str) -> list[dict]:
+    objects: list[dict] = []
+    for match in _LD_JSON_SCRIPT.finditer(html):
+        try:
+            objects.extend(flatten_json_ld(json.loads(match.group(1))))
+        except ValueError:
+            continue
+    return objects
+
+
+def _meta_price(meta: dict[str, str]) -> int | None:
+    for prefix in ("product:price", "og:price"):
+        currency = meta.get(f"{prefix}:currency")
+        if currency and currency.upper() not in _RUB:
+            continue
+        amount = parse_amount(meta.get(f"{prefix}:amount"))
+        if amount is not None:
+            return amount
+    return None
+
+
+def _microdata_price(html: str) -> int | None:
+    for match in _ITEMPROP_PRICE.finditer(html):
+        content = _CONTENT_ATTR.search(match.group(0))
+        amount = parse_amount(content.group(1) if content else match.group(1))
+        if amount is not None:
+            return amount
+    return None
+
+
+def extract_price(text: str | None) -> int | None:
+    """First plausible ruble amount written out in the text."""
+    if not text:
+        return None
+    for match in _TEXT_PRICE.finditer(text):
+        amount = parse_amount(match.group(1))
+        if amount is not None:
+            return amount
+    return None
+
+
+def find_price(html: str, head: HeadMeta) -> PriceInfo | None:
+    """Best price on the page: structured data first, text heuristics last."""
+    amount = _json_ld_price(head.json_ld)
+    if amount is None and "application/ld+json" in html:
+        amount = _json_ld_price(_body_json_ld(html))
+    if amount is not None:
+        return PriceInfo(amount, "json-ld")
+    amount = _meta_price(head.meta)
+    if amount is not None:
+        return PriceInfo(amount, "meta")
+    amount = _microdata_price(html) if "itemprop" in html else None
+    if amount is not None:
+        return PriceInfo(amount, "microdata")
+    amount = extract_price(html)
+    if amount is not None:
+        return PriceInfo(amount, "text")
+    return None
@@ -2,30 +2,64 @@ import secrets
 import string
 
 from slugify import slugify
-from sqlalchemy import select
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.wishlist import Wishlist
 
+SUFFIX_ALPHABET = string.ascii_lowercase + string.digits
+
 
 def generate_slug(title: str) -> str:
     return slugify(title, max_length=100)
 
 
-async def create_unique_slug(title: str, db: AsyncSession, max_attempts: int = 5) -> str:
-    base_slug = generate_slug(title)
-    if not base_slug:
-        base_slug = "wishlist"
+async def get_taken_slugs(base_slug: str, db: AsyncSession) -> set[str]:
+    """All slugs equal to base_slug or derived from it, in one prefix-index query."""
+    result = await db.execute(
+        select(Wishlist.slug).where(
+            or_(
+                Wishlist.slug == base_slug,
+                Wishlist.slug.startswith(f"{base_slug}-", autoescape=True),
+            )
+        )
+    )
+    return set(result.scalars().all())
+
+
+def pick_free_slug(base_slug: str, taken: set[str]) -> str:
+    if base_slug not in taken:
+        return base_slug
+    while True:
+        suffix = "".join(secrets.choice(SUFFIX_ALPHABET) for _ in range(4))
+        slug = f"{base_slug}-{suffix}"
+        if slug not in taken:
+            return slug
+
+
+async def insert_wishlist_with_slug(
+    db: AsyncSession, values: dict, max_attempts: int = 5
+) -> Wishlist:
+    """Insert a wishlist row under a free slug derived from values["title"].
+
+    Taken slugs are fetched once; a concurrent insert that grabs the same
+    slug only costs a retry thanks to ON CONFLICT DO NOTHING.
+    """
+    base_slug = generate_slug(values["title"]) or "wishlist"
+    taken = await get_taken_slugs(base_slug, db)
 
-    slug = base_slug
     for _ in range(max_attempts):
+        slug = pick_free_slug(base_slug, taken)
         result = await db.execute(
-            select(Wishlist.id).where(Wishlist.slug == slug).limit(1)
+            insert(Wishlist)
+            .values(slug=slug, **values)
+            .on_conflict_do_nothing(index_elements=[Wishlist.slug])
+            .returning(Wishlist)
         )
-        if not result.scalar_one_or_none():
-            return slug
-        suffix = "".join(secrets.choice(string.ascii_lowercase + string.digits) for _ in range(4))
-        slug = f"{base_slug}-{suffix}"
+        wishlist = result.scalar_one_or_none()
+        if wishlist is not None:
+            return wishlist
+        taken.add(slug)
 
-    # Last attempt — return and let DB unique constraint handle collision
-    return slug
+    raise RuntimeError(f"Could not allocate a unique slug for {base_slug!r}")
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import after_commit
+
+logger = logging.getLogger(__name__)
+
+# Strong references: the event loop only keeps weak ones to running tasks
+_running: set[asyncio.Task] = set()
+
+
+def spawn(coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+    """Run a coroutine detached from the request, logging any failure.
+
+    Unlike BackgroundTasks, it does not wait for the request's dependencies
+    (and their open transaction) to finish.
+    """
+    task = asyncio.create_task(coro, name=name)
+    _running.add(task)
+    task.add_done_callback(_on_done)
+    return task
+
+
+def spawn_after_commit(
+    session: AsyncSession, factory: Callable[[], Coroutine[Any, Any, Any]], name: str
+) -> None:
+    """Spawn once the session's transaction commits; never if it rolls back.
+
+    For work that reads or updates the rows the request is still writing.
+    """
+    after_commit(session, lambda: spawn(factory(), name=name))
+
+
+def _on_done(task: asyncio.Task) -> None:
+    _running.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task %s failed", task.get_name(), exc_info=task.exception())
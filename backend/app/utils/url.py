@@ -0,0 +1,56 @@
+from collections.abc import Callable, Collection
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from, on any site.
+# Site-specific ones are dropped by the marketplace adapters' resolve().
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "yclid", "ysclid", "igshid", "msclkid", "_openstat",
+    "mc_cid", "mc_eid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking_param(name: str) -> bool:
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _param_name(piece: str) -> str:
+    return unquote_plus(piece.partition("=")[0]).lower()
+
+
+def _filter_query(query: str, drop: Callable[[str], bool]) -> list[str]:
+    """Raw ``name=value`` pieces whose lowercased name ``drop`` rejects are left out.
+
+    Pieces keep their exact text, so a valueless ``?1234`` stays ``1234``.
+    """
+    return [piece for piece in query.split("&") if piece and not drop(_param_name(piece))]
+
+
+def strip_params(url: str, names: Collection[str]) -> str:
+    """``url`` without the given query parameters (lowercase names); the rest untouched."""
+    parts = urlsplit(url)
+    query = "&".join(_filter_query(parts.query, lambda name: name in names))
+    return urlunsplit(parts._replace(query=query))
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a product URL so that links to the same page compare equal.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, and sorts the remaining query. Meant as a cache key: the
+    page itself is fetched from the link as given.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal: hostname comes back unbracketed
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        _filter_query(parts.query, _is_tracking_param),
+        key=lambda piece: (_param_name(piece), piece),
+    )
+    return urlunsplit((scheme, host, parts.path or "/", "&".join(query), ""))
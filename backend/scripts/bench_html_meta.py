@@ -0,0 +1,80 @@
+"""Compare page metadata extraction against the old BeautifulSoup path.
+
+Usage (from backend/, with beautifulsoup4 installed — it is not a runtime
+dependency any more):
+
+    python scripts/bench_html_meta.py [path/to/corpus] [--rounds 20]
+
+The corpus is a directory of saved product pages (*.html, UTF-8), by default
+the fixture pages in tests/fixtures/pages. For each
+page both extractors run ``--rounds`` times; the script prints the mean time
+per parse and flags pages where the extracted title/image/description differ.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND))
+
+from app.core.constants import URL_PARSER_MAX_CONTENT_LENGTH  # noqa: E402
+from app.utils.html_meta import extract_head_meta  # noqa: E402
+
+
+def soup_meta(html: str) -> tuple:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    og_title = soup.find("meta", property="og:title")
+    og_image = soup.find("meta", property="og:image")
+    og_description = soup.find("meta", property="og:description")
+    title = og_title["content"] if og_title and og_title.get("content") else None
+    if not title:
+        title_tag = soup.find("title")
+        title = title_tag.string.strip() if title_tag and title_tag.string else None
+    image_url = og_image["content"] if og_image and og_image.get("content") else None
+    description = og_description["content"] if og_description and og_description.get("content") else None
+    return title, image_url, description
+
+
+def head_meta(html: str) -> tuple:
+    head = extract_head_meta(html)
+    return (
+        head.meta.get("og:title") or head.title,
+        head.meta.get("og:image"),
+        head.meta.get("og:description"),
+    )
+
+
+def bench(func, html: str, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(html)
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("corpus", type=Path, nargs="?", default=BACKEND / "tests" / "fixtures" / "pages")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = sorted(args.corpus.glob("*.html"))
+    if not pages:
+        sys.exit(f"No *.html files in {args.corpus}")
+
+    ratios = []
+    for page in pages:
+        html = page.read_text(encoding="utf-8", errors="replace")[:URL_PARSER_MAX_CONTENT_LENGTH]
+        old = bench(soup_meta, html, args.rounds)
+        new = bench(head_meta, html, args.rounds)
+        ratios.append(old / new)
+        mismatch = "" if soup_meta(html) == head_meta(html) else "  MISMATCH"
+        print(f"{page.name:40} {len(html) // 1024:6} KB  bs4 {old * 1000:8.2f} ms  lxml {new * 1000:7.2f} ms  x{old / new:6.1f}{mismatch}")
+    print(f"\n{len(pages)} pages, median speedup x{statistics.median(ratios):.1f}")
+
+
+if __name__ == "__main__":
+    main()
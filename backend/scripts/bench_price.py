@@ -0,0 +1,100 @@
+"""Compare structured price extraction against the old regex-only heuristic.
+
+Usage (from backend/):
+
+    python scripts/bench_price.py [path/to/fixtures] [--rounds 20]
+
+Fixtures are saved product pages: ``<name>.html`` (UTF-8) plus an optional
+``<name>.price`` holding the expected price in whole rubles; by default the
+labelled pages in tests/fixtures/pages. The script
+reports per-page timings, which source won, and accuracy over the pages
+that have an expected price. The head metadata is parsed once up front:
+parse_url needs it for the title anyway, so only the price stage is timed.
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND))
+
+from app.core.config import settings  # noqa: E402
+from app.utils.html_meta import extract_head_meta  # noqa: E402
+from app.utils.price import find_price  # noqa: E402
+
+
+def regex_price(html: str) -> int | None:
+    """The previous extract_price, applied to the first 50 KB as before."""
+    text = html[:50000]
+    patterns = [
+        r'([\d\s]+)\s*(?:₽|руб|рублей|RUB)',
+        r'(?:от\s+)?([\d\s]+)\s*(?:₽|руб)',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            price_str = match.group(1).replace(" ", "").replace("\xa0", "")
+            try:
+                price = int(price_str)
+                if 1 <= price <= 10_000_000:
+                    return price
+            except ValueError:
+                continue
+    return None
+
+
+def bench(func, args: tuple, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(*args)
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fixtures", type=Path, nargs="?", default=BACKEND / "tests" / "fixtures" / "pages")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = sorted(args.fixtures.glob("*.html"))
+    if not pages:
+        sys.exit(f"No *.html files in {args.fixtures}")
+
+    old_hits = new_hits = labelled = 0
+    ratios = []
+    for page in pages:
+        # What the fetcher hands over: the head plus the price-scan budget
+        html = page.read_text(encoding="utf-8", errors="replace")
+        head_end = html.lower().find("</head>")
+        html = html[:max(head_end + 7, settings.URL_PARSER_PRICE_SCAN_BYTES)]
+
+        head = extract_head_meta(html)
+        old_time = bench(regex_price, (html,), args.rounds)
+        new_time = bench(find_price, (html, head), args.rounds)
+        ratios.append(old_time / new_time)
+        old, new = regex_price(html), find_price(html, head)
+
+        expected_file = page.with_suffix(".price")
+        verdict = ""
+        if expected_file.exists():
+            expected = int(expected_file.read_text().strip())
+            labelled += 1
+            old_hits += old == expected
+            new_hits += new is not None and new.amount == expected
+            verdict = f"  expected {expected}"
+        source = f"{new.amount} ({new.source})" if new else "-"
+        print(
+            f"{page.name:40} regex {old!s:>9} {old_time * 1000:7.2f} ms   "
+            f"structured {source:>22} {new_time * 1000:7.2f} ms{verdict}"
+        )
+
+    print(f"\n{len(pages)} pages, median time ratio regex/structured x{statistics.median(ratios):.2f}")
+    if labelled:
+        print(f"accuracy: regex {old_hits}/{labelled}, structured {new_hits}/{labelled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@dataclass
+class StubRequest:
+    path: str
+    headers: dict[str, str]
+    client_port: int
+
+
+class StubServer:
+    """Canned responses by path, served over real HTTP on 127.0.0.1."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[int, dict[str, str], bytes, float]] = {}
+        self.requests: list[StubRequest] = []
+        self.url = ""
+
+    def add(
+        self, path: str, body: bytes | str = b"", status: int = 200, headers: dict | None = None, delay: float = 0
+    ) -> None:
+        """Serve ``body`` at ``path``, ``delay`` seconds after the request arrives."""
+        if isinstance(body, str):
+            body = body.encode()
+        self.routes[path] = (status, headers or {}, body, delay)
+
+    def count(self, path: str) -> int:
+        return sum(1 for request in self.requests if urlsplit(request.path).path == path)
+
+
+def _handler(stub: StubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like real upstreams
+
+        def do_GET(self) -> None:
+            stub.requests.append(StubRequest(self.path, dict(self.headers), self.client_address[1]))
+            status, headers, body, delay = stub.routes.get(urlsplit(self.path).path, (404, {}, b"", 0))
+            time.sleep(delay)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def stub_server():
+    stub = StubServer()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(stub))
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def public_hosts(monkeypatch):
+    """Let the SSRF guard pass loopback; returns a helper pointing names at 127.0.0.1."""
+    from app.utils import ssrf
+    from app.utils.cache import TTLCache
+
+    monkeypatch.setattr(ssrf, "_is_private_ip", lambda ip: False)
+    monkeypatch.setattr(ssrf, "BLOCKED_HOSTS", {"localhost"})
+    monkeypatch.setattr(ssrf, "_dns_cache", TTLCache(maxsize=64, ttl=600))
+
+    def point(*names: str) -> None:
+        for name in names:
+            ssrf._dns_cache.set(name, ("127.0.0.1",))
+
+    return point
+
+
+async def _fresh_client_ip(request: httpx.Request) -> None:
+    # Per-IP rate limits would otherwise trip across the suite
+    request.headers["X-Forwarded-For"] = f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+
+
+@pytest.fixture
+async def database():
+    """Skips the test when DATABASE_URL is unreachable."""
+    from sqlalchemy import text
+
+    from app.core.database import engine
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as exc:
+        await engine.dispose()
+        pytest.skip(f"database not available: {exc}")
+    yield
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+async def api(database):
+    """Client for the app over ASGI."""
+    from app.main import app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test/api",
+        event_hooks={"request": [_fresh_client_ip]},
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+async def auth_headers(api):
+    """Authorization header of a freshly registered user."""
+    response = await api.post(
+        "/auth/register",
+        json={"email": f"u{uuid.uuid4().hex[:12]}@example.com", "password": "password123", "name": "Tester"},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
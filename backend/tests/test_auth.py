@@ -0,0 +1,73 @@
+import uuid
+
+import pytest
+
+from app.api.endpoints.auth import _find_or_create_google_user
+from app.core.database import async_session
+from app.core.principal_cache import principal_cache
+from app.core.revocation import revocations
+from app.core.security import decode_access_token
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def account(api):
+    """(email, access token) of a freshly registered user."""
+    email = f"u{uuid.uuid4().hex[:12]}@example.com"
+    response = await api.post("/auth/register", json={"email": email, "password": "password123", "name": "Tester"})
+    assert response.status_code == 200, response.text
+    return email, response.json()["access_token"]
+
+
+async def _me(api, token: str):
+    return await api.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+async def test_logout_revokes_cached_token(api, account):
+    _, token = account
+    assert (await _me(api, token)).status_code == 200
+    assert principal_cache.get(token) is not None
+
+    assert (await api.post("/auth/logout", headers={"Authorization": f"Bearer {token}"})).status_code == 200
+
+    assert principal_cache.get(token) is None
+    assert revocations.is_revoked(decode_access_token(token)["jti"])
+    response = await _me(api, token)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+async def test_logout_all_rejects_older_token_versions(api, account):
+    email, token = account
+    other = (await api.post("/auth/login", json={"email": email, "password": "password123"})).json()["access_token"]
+    assert (await _me(api, other)).status_code == 200
+
+    assert (await api.post("/auth/logout-all", headers={"Authorization": f"Bearer {token}"})).status_code == 200
+
+    for old in (token, other):
+        response = await _me(api, old)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token has been revoked"
+    fresh = (await api.post("/auth/login", json={"email": email, "password": "password123"})).json()["access_token"]
+    assert (await _me(api, fresh)).status_code == 200
+
+
+async def test_garbage_token_rejected(api):
+    response = await _me(api, "not-a-jwt")
+
+    assert response.status_code == 401
+
+
+async def test_google_merge_invalidates_only_after_commit(api, account):
+    email, token = account
+    assert (await _me(api, token)).status_code == 200
+
+    async with async_session() as db:
+        async with db.begin():
+            await _find_or_create_google_user(db, email, "Tester", "https://example.com/a.png", "google-sub")
+            # Still uncommitted: another request would reload the old row
+            assert principal_cache.get(token) is not None
+        assert principal_cache.get(token) is None
+
+    assert (await _me(api, token)).json()["avatar_url"] == "https://example.com/a.png"
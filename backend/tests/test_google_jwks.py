@@ -0,0 +1,115 @@
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core import google_jwks
+from app.core.google_jwks import GoogleKeySet
+
+pytestmark = pytest.mark.anyio
+
+AUDIENCE = "client-id.apps.googleusercontent.com"
+
+
+def _rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwks(*keys: tuple[str, rsa.RSAPrivateKey]) -> str:
+    jwks = []
+    for kid, private in keys:
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private.public_key(), as_dict=True)
+        jwks.append({**jwk, "kid": kid, "use": "sig", "alg": "RS256"})
+    return json.dumps({"keys": jwks})
+
+
+def _token(private, kid: str, **claims) -> str:
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": AUDIENCE,
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 3600,
+        **claims,
+    }
+    return jwt.encode(payload, private, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture
+def key_a():
+    return _rsa_key()
+
+
+@pytest.fixture
+def jwks_server(stub_server, key_a):
+    stub_server.add(
+        "/certs",
+        _jwks(("a", key_a)),
+        headers={"Content-Type": "application/json", "Cache-Control": "public, max-age=3600"},
+    )
+    return stub_server
+
+
+@pytest.fixture
+def keys(jwks_server):
+    return GoogleKeySet(f"{jwks_server.url}/certs")
+
+
+async def test_valid_token_passes(keys, key_a, jwks_server):
+    claims = await keys.verify(_token(key_a, "a"), AUDIENCE)
+
+    assert claims["sub"] == "1234567890"
+    assert claims["email"] == "user@example.com"
+    # The second verification is served from the cached key set
+    await keys.verify(_token(key_a, "a"), AUDIENCE)
+    assert jwks_server.count("/certs") == 1
+
+
+async def test_unknown_kid_forces_refresh_after_rotation(keys, key_a, jwks_server, monkeypatch):
+    monkeypatch.setattr(google_jwks, "GOOGLE_JWKS_MIN_REFRESH_INTERVAL", 0)
+    await keys.verify(_token(key_a, "a"), AUDIENCE)
+
+    key_b = _rsa_key()
+    jwks_server.add(
+        "/certs",
+        _jwks(("b", key_b)),
+        headers={"Content-Type": "application/json", "Cache-Control": "public, max-age=3600"},
+    )
+    claims = await keys.verify(_token(key_b, "b"), AUDIENCE)
+
+    assert claims["sub"] == "1234567890"
+    assert jwks_server.count("/certs") == 2
+    # Key "a" was rotated out together with the old set
+    with pytest.raises(ValueError):
+        await keys.verify(_token(key_a, "a"), AUDIENCE)
+
+
+async def test_unknown_kid_refresh_is_throttled(keys, key_a, jwks_server):
+    await keys.verify(_token(key_a, "a"), AUDIENCE)
+
+    with pytest.raises(ValueError, match="Unknown Google key id"):
+        await keys.verify(_token(_rsa_key(), "b"), AUDIENCE)
+    assert jwks_server.count("/certs") == 1
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        pytest.param({"exp": int(time.time()) - 60}, id="expired"),
+        pytest.param({"aud": "someone-else.apps.googleusercontent.com"}, id="wrong-audience"),
+        pytest.param({"iss": "https://evil.example.com"}, id="wrong-issuer"),
+    ],
+)
+async def test_invalid_claims_rejected(keys, key_a, claims):
+    with pytest.raises(ValueError):
+        await keys.verify(_token(key_a, "a", **claims), AUDIENCE)
+
+
+async def test_forged_signature_rejected(keys):
+    # Known kid, but signed by a key that is not in the set
+    with pytest.raises(ValueError):
+        await keys.verify(_token(_rsa_key(), "a"), AUDIENCE)
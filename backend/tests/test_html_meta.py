@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+import lxml.html
+import pytest
+
+from app.utils.html_meta import _WANTED_META, extract_head_meta, flatten_json_ld
+
+PAGES = sorted((Path(__file__).parent / "fixtures" / "pages").glob("*.html"))
+
+
+def full_document_meta(html: str) -> tuple[dict, str | None, list]:
+    """The old full-tree lookup: first og/twitter meta and <title> anywhere
+    in the page, plus JSON-LD from scripts above the page's <body> tag."""
+    doc = lxml.html.document_fromstring(html)
+    meta: dict[str, str] = {}
+    for el in doc.iter("meta"):
+        key = (el.get("property") or el.get("name") or "").lower()
+        content = el.get("content")
+        if key in _WANTED_META and content and key not in meta:
+            meta[key] = content.strip()
+    title_el = doc.find(".//title")
+    title = (title_el.text or "").strip() or None if title_el is not None else None
+    body_line = _body_tag_line(html)
+    json_ld = []
+    for script in doc.iter("script"):
+        if script.sourceline < body_line and (script.get("type") or "").lower() == "application/ld+json":
+            json_ld.extend(flatten_json_ld(json.loads(script.text)))
+    return meta, title, json_ld
+
+
+def _body_tag_line(html: str) -> int:
+    for number, line in enumerate(html.splitlines(), 1):
+        if line.lstrip().lower().startswith("<body"):
+            return number
+    return html.count("\n") + 2
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda page: page.stem)
+def test_head_meta_matches_full_document_parse(page):
+    html = page.read_text(encoding="utf-8")
+    meta, title, json_ld = full_document_meta(html)
+
+    head = extract_head_meta(html)
+
+    assert head.meta == meta
+    assert head.title == title
+    assert head.json_ld == json_ld
+
+
+def test_fixtures_cover_every_source():
+    found = [extract_head_meta(page.read_text(encoding="utf-8")) for page in PAGES]
+    assert any("og:title" in head.meta for head in found)
+    assert any("twitter:title" in head.meta and "og:title" not in head.meta for head in found)
+    assert any(not head.meta and head.title for head in found)
+    assert any(head.json_ld for head in found)
+
+
+def test_stray_element_in_head_does_not_hide_later_meta():
+    html = (
+        "<html><head><title>T</title><div>cookie banner</div>"
+        '<meta property="og:title" content="Product"></head>'
+        '<body><meta property="og:image" content="banner.jpg"></body></html>'
+    )
+
+    head = extract_head_meta(html)
+
+    assert head.meta == {"og:title": "Product"}
+    assert head.title == "T"
+
+
+def test_stops_at_body():
+    html = '<html><head><title>T</title></head><body><meta property="og:title" content="late"><title>x</title></body></html>'
+
+    assert extract_head_meta(html) == ({}, "T", [])
@@ -0,0 +1,67 @@
+import httpx
+import pytest
+
+from app.core.http_client import stream_pinned
+from app.utils.ssrf import BlockedHostError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def port(stub_server):
+    return stub_server.url.rsplit(":", 1)[1]
+
+
+async def test_pinned_fetch_keeps_name_for_host_header(stub_server, public_hosts, port):
+    public_hosts("shop.test")
+    stub_server.add("/item", "<html></html>", headers={"Content-Type": "text/html"})
+
+    async with stream_pinned(f"http://shop.test:{port}/item") as response:
+        body = await response.aread()
+
+    assert response.status_code == 200
+    assert body == b"<html></html>"
+    assert stub_server.requests[0].headers["Host"] == f"shop.test:{port}"
+
+
+async def test_redirect_is_followed(stub_server, public_hosts, port):
+    public_hosts("a.test", "b.test")
+    stub_server.add("/start", status=302, headers={"Location": f"http://b.test:{port}/end"})
+    stub_server.add("/end", "done")
+
+    async with stream_pinned(f"http://a.test:{port}/start") as response:
+        assert await response.aread() == b"done"
+
+    assert [r.headers["Host"] for r in stub_server.requests] == [f"a.test:{port}", f"b.test:{port}"]
+
+
+async def test_connection_is_not_shared_between_names_on_one_address(stub_server, public_hosts, port):
+    public_hosts("a.test", "b.test")
+    stub_server.add("/", "ok")
+
+    for host in ("a.test", "b.test"):
+        async with stream_pinned(f"http://{host}:{port}/") as response:
+            await response.aread()
+
+    first, second = stub_server.requests
+    # Both names resolve to 127.0.0.1: a kept-alive connection (and in TLS
+    # its certificate) must not be handed from one name to the other
+    assert first.client_port != second.client_port
+
+
+async def test_redirect_to_blocked_host_is_refused(stub_server, public_hosts, port):
+    public_hosts("a.test")
+    stub_server.add("/start", status=302, headers={"Location": "http://localhost/admin"})
+
+    with pytest.raises(BlockedHostError):
+        async with stream_pinned(f"http://a.test:{port}/start"):
+            pass
+
+
+async def test_too_many_redirects(stub_server, public_hosts, port):
+    public_hosts("a.test")
+    stub_server.add("/loop", status=302, headers={"Location": "/loop"})
+
+    with pytest.raises(httpx.TooManyRedirects):
+        async with stream_pinned(f"http://a.test:{port}/loop"):
+            pass
@@ -0,0 +1,77 @@
+import io
+import uuid
+from datetime import timedelta
+
+import pytest
+from PIL import ExifTags, Image
+
+from app.core.constants import IMAGE_MIRROR_GC_GRACE, IMAGE_MIRROR_WIDTH
+from app.core.database import async_session, utcnow
+from app.models.mirrored_image import MirroredImage
+from app.utils import image_mirror
+from app.utils.image_mirror import _Rejected, _render
+
+
+def _jpeg(size: tuple[int, int], orientation: int | None = None) -> bytes:
+    img = Image.new("RGB", size, (200, 30, 30))
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[ExifTags.Base.Orientation] = orientation
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", exif=exif.tobytes())
+    return buf.getvalue()
+
+
+def _size(data: bytes) -> tuple[int, int]:
+    with Image.open(io.BytesIO(data)) as img:
+        return img.size
+
+
+def test_copy_is_webp_scaled_to_width():
+    data = _render(_jpeg((3200, 1600)))
+
+    assert data[8:12] == b"WEBP"
+    assert _size(data) == (IMAGE_MIRROR_WIDTH, IMAGE_MIRROR_WIDTH // 2)
+
+
+def test_exif_rotated_photo_keeps_full_width():
+    # Stored landscape, shown portrait: the draft must not shrink it below 800 wide
+    data = _render(_jpeg((3200, 1600), orientation=6))
+
+    assert _size(data) == (IMAGE_MIRROR_WIDTH, IMAGE_MIRROR_WIDTH * 2)
+
+
+def test_small_image_is_not_upscaled():
+    assert _size(_render(_jpeg((300, 200)))) == (300, 200)
+
+
+def test_non_image_is_rejected():
+    with pytest.raises(_Rejected):
+        _render(b"<html>not an image</html>")
+
+
+@pytest.mark.anyio
+async def test_collector_removes_unused_copies(api, auth_headers, tmp_path, monkeypatch):
+    monkeypatch.setattr(image_mirror, "UPLOAD_DIR", tmp_path)
+    used, unused = uuid.uuid4().hex * 2, uuid.uuid4().hex * 2
+    wishlist = (await api.post("/wishlists", json={"title": "GC"}, headers=auth_headers)).json()
+    response = await api.post(
+        f"/wishlists/{wishlist['id']}/items",
+        json={"title": "Mirrored", "image_url": image_mirror._local_url(used)},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+
+    old = utcnow() - timedelta(seconds=IMAGE_MIRROR_GC_GRACE + 60)
+    async with async_session() as db:
+        async with db.begin():
+            for key in (used, unused):
+                db.add(MirroredImage(source_hash=key, source_url=key, status="done", updated_at=old))
+                image_mirror._write(key, b"webp")
+
+    await image_mirror.collect_unused()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [image_mirror._file_name(used)]
+    async with async_session() as db:
+        assert await db.get(MirroredImage, used) is not None
+        assert await db.get(MirroredImage, unused) is None
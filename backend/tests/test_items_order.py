@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import update
+
+from app.core.database import async_session
+from app.models.item import WishlistItem
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def items(api, auth_headers):
+    """Ids of four items a0..a3 in a new wishlist, in list order."""
+    wishlist = (await api.post("/wishlists", json={"title": "Order"}, headers=auth_headers)).json()
+    response = await api.post(
+        f"/wishlists/{wishlist['id']}/items/bulk",
+        json={"items": [{"title": f"a{i}"} for i in range(4)]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201, response.text
+    return wishlist["id"], [item["id"] for item in response.json()]
+
+
+async def _titles(api, auth_headers, wishlist_id) -> list[str]:
+    response = await api.get(f"/wishlists/{wishlist_id}/items", headers=auth_headers)
+    return [item["title"] for item in response.json()["items"]]
+
+
+async def _move(api, auth_headers, item_id, prev_id=None, next_id=None):
+    return await api.patch(
+        f"/items/{item_id}/move", json={"prev_id": prev_id, "next_id": next_id}, headers=auth_headers
+    )
+
+
+async def _set_positions(positions: dict[str, int]) -> None:
+    async with async_session() as db:
+        async with db.begin():
+            for item_id, position in positions.items():
+                await db.execute(update(WishlistItem).where(WishlistItem.id == item_id).values(position=position))
+
+
+async def test_move_between_neighbours(api, auth_headers, items):
+    wishlist_id, ids = items
+
+    response = await _move(api, auth_headers, ids[3], prev_id=ids[0], next_id=ids[1])
+
+    assert response.status_code == 200, response.text
+    assert await _titles(api, auth_headers, wishlist_id) == ["a0", "a3", "a1", "a2"]
+
+
+async def test_move_to_head_and_tail(api, auth_headers, items):
+    wishlist_id, ids = items
+
+    assert (await _move(api, auth_headers, ids[2], next_id=ids[0])).status_code == 200
+    assert (await _move(api, auth_headers, ids[1], prev_id=ids[3])).status_code == 200
+
+    assert await _titles(api, auth_headers, wishlist_id) == ["a2", "a0", "a3", "a1"]
+
+
+@pytest.mark.parametrize("gap", [0, 1])
+async def test_no_room_between_neighbours_forces_rebalance(api, auth_headers, items, gap):
+    wishlist_id, ids = items
+    await _set_positions({ids[0]: 1000, ids[1]: 1000 + gap, ids[2]: 3000, ids[3]: 4000})
+
+    response = await _move(api, auth_headers, ids[3], prev_id=ids[0], next_id=ids[1])
+
+    assert response.status_code == 200, response.text
+    assert await _titles(api, auth_headers, wishlist_id) == ["a0", "a3", "a1", "a2"]
+
+
+async def test_reversed_neighbours_conflict(api, auth_headers, items):
+    wishlist_id, ids = items
+
+    response = await _move(api, auth_headers, ids[3], prev_id=ids[1], next_id=ids[0])
+
+    assert response.status_code == 409
+    assert await _titles(api, auth_headers, wishlist_id) == ["a0", "a1", "a2", "a3"]
+
+
+@pytest.mark.parametrize("neighbours", ["same", "self"])
+async def test_invalid_neighbours_rejected(api, auth_headers, items, neighbours):
+    _, ids = items
+    prev_id, next_id = (ids[1], ids[1]) if neighbours == "same" else (ids[3], ids[0])
+
+    response = await _move(api, auth_headers, ids[3], prev_id=prev_id, next_id=next_id)
+
+    assert response.status_code == 400
+
+
+async def test_reorder_items(api, auth_headers, items):
+    wishlist_id, ids = items
+    order = [ids[2], ids[0], "not-a-uuid", ids[3], ids[1]]
+
+    response = await api.patch(
+        f"/wishlists/{wishlist_id}/items/reorder",
+        json={"items": [{"id": item_id, "position": i} for i, item_id in enumerate(order)]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert await _titles(api, auth_headers, wishlist_id) == ["a2", "a0", "a3", "a1"]
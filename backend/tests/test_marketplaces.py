@@ -0,0 +1,233 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.api.endpoints import parse_url
+from app.core import http_client
+from app.utils.marketplaces import registry, wb_baskets, wildberries
+from app.utils.marketplaces.base import AdapterRegistry, MarketplaceAdapter
+
+pytestmark = pytest.mark.anyio
+
+FIXTURES = Path(__file__).parent / "fixtures" / "marketplaces"
+
+NM_ID = 123456789  # vol 1234: basket 09 by the static table
+WB_CDN = "/basket-09.wbbasket.ru/vol1234/part123456/123456789"
+
+
+class _ToStub(httpx.AsyncBaseTransport):
+    """Sends every request to the stub server as /<original host><path>."""
+
+    def __init__(self, stub_url: str):
+        self._stub_url = stub_url
+        self._transport = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.headers["host"].split(":")[0]
+        url = httpx.URL(f"{self._stub_url}/{host}{request.url.raw_path.decode()}")
+        headers = [(k, v) for k, v in request.headers.raw if k.lower() != b"host"]
+        return await self._transport.handle_async_request(httpx.Request(request.method, url, headers=headers))
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@pytest.fixture
+async def upstream(stub_server, public_hosts, monkeypatch):
+    """Marketplace hosts answered from recorded fixtures on the stub server."""
+    public_hosts("www.ozon.ru", "market.yandex.ru", "aliexpress.ru", "www.lamoda.ru")
+    client = httpx.AsyncClient(transport=_ToStub(stub_server.url))
+    monkeypatch.setattr(http_client, "_client", client)
+    monkeypatch.setattr(
+        http_client, "_pinned_client", lambda: httpx.AsyncClient(transport=_ToStub(stub_server.url))
+    )
+    monkeypatch.setattr(wb_baskets, "_loaded", True)  # no learned baskets, no database
+    yield stub_server
+    await client.aclose()
+
+
+async def _parse(url: str):
+    fetch_url, _ = await parse_url._resolve(url)
+    return await parse_url._parse(fetch_url)
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+async def test_wildberries(upstream):
+    upstream.add(f"{WB_CDN}/info/ru/card.json", _fixture("wb_card.json"), headers={"Content-Type": "application/json"})
+    upstream.add(f"{WB_CDN}/info/price-history.json", _fixture("wb_price_history.json"))
+
+    result = await _parse(f"https://www.wildberries.ru/catalog/{NM_ID}/detail.aspx?targetUrl=GP&size=1")
+
+    assert result.title == "Кроссовки беговые AirRun"
+    assert result.price == 4890
+    assert result.price_source == "marketplace"
+    assert result.image_url == f"https://basket-09.wbbasket.ru/vol1234/part123456/{NM_ID}/images/big/1.webp"
+
+
+async def test_wildberries_price_from_search_when_history_is_missing(upstream):
+    upstream.add(f"{WB_CDN}/info/ru/card.json", _fixture("wb_card.json"))
+    upstream.add("/search.wb.ru/exactmatch/ru/common/v9/search", _fixture("wb_search.json"))
+
+    result = await _parse(f"https://wildberries.ru/catalog/{NM_ID}/detail.aspx")
+
+    assert result.title == "Кроссовки беговые AirRun"
+    assert result.price == 4750
+
+
+async def test_wildberries_slow_price_keeps_the_card(upstream, monkeypatch):
+    monkeypatch.setattr(wildberries, "WB_PRICE_DEADLINE", 0.3)
+    monkeypatch.setattr(registry.find("wildberries.ru"), "timeout", 0.8)
+    upstream.add(f"{WB_CDN}/info/ru/card.json", _fixture("wb_card.json"))
+    upstream.add(f"{WB_CDN}/info/price-history.json", _fixture("wb_price_history.json"), delay=1.5)
+    upstream.add("/search.wb.ru/exactmatch/ru/common/v9/search", _fixture("wb_search.json"), delay=1.5)
+
+    result = await _parse(f"https://www.wildberries.ru/catalog/{NM_ID}/detail.aspx")
+
+    assert result.title == "Кроссовки беговые AirRun"
+    assert result.image_url == f"https://basket-09.wbbasket.ru/vol1234/part123456/{NM_ID}/images/big/1.webp"
+    assert result.price is None
+
+
+async def test_ozon_short_link(upstream):
+    upstream.add(
+        "/www.ozon.ru/t/AbC1dE2",
+        status=302,
+        headers={"Location": "https://www.ozon.ru/product/nabor-posudy-12-predmetov-1488220011/"},
+    )
+
+    fetch_url, key = await parse_url._resolve("https://www.ozon.ru/t/AbC1dE2")
+    result = await parse_url._parse(fetch_url)
+
+    assert fetch_url == key == "https://www.ozon.ru/product/nabor-posudy-12-predmetov-1488220011/"
+    assert result.title == "Nabor posudy 12 predmetov"
+    assert result.price is None
+    assert result.image_url is None
+
+
+async def test_ozon_drops_its_own_tracking_params():
+    url = "https://www.ozon.ru/product/nabor-1488220011/?asb=x&keywords=pan&from=share&utm_source=tg&oos_search=false"
+
+    fetch_url, key = await parse_url._resolve(url)
+
+    assert fetch_url == "https://www.ozon.ru/product/nabor-1488220011/?utm_source=tg&oos_search=false"
+    assert key == "https://www.ozon.ru/product/nabor-1488220011/?oos_search=false"
+
+
+async def test_generic_page_is_fetched_as_given(upstream, public_hosts):
+    public_hosts("shop.test")
+    upstream.add("/shop.test/item/41", "<html><head><title>Чайник</title></head></html>")
+
+    first = await parse_url._parse_one("http://shop.test/item/41?from=feed&1234&utm_source=tg")
+    second = await parse_url._parse_one("http://SHOP.test/item/41?1234&from=feed#reviews")
+
+    assert first.title == second.title == "Чайник"
+    # One fetch for both links, with the query exactly as the user pasted it
+    assert [request.path for request in upstream.requests] == ["/shop.test/item/41?from=feed&1234&utm_source=tg"]
+
+
+async def test_yandex_market(upstream):
+    url = "https://m.market.yandex.ru/product--smartfon-apple-iphone-15/1234567?sku=101&cpc=abc&utm_source=tg"
+
+    fetch_url, key = await parse_url._resolve(url)
+    result = await parse_url._parse(fetch_url)
+
+    assert fetch_url == key == "https://market.yandex.ru/product--smartfon-apple-iphone-15/1234567?sku=101"
+    assert result.title == "Smartfon apple iphone 15"
+    assert result.price is None
+    assert result.image_url is None
+    assert upstream.requests == []  # the captcha-guarded page is never fetched
+
+
+async def test_aliexpress(upstream):
+    upstream.add(
+        "/aliexpress.ru/item/1005006123456789.html",
+        _fixture("aliexpress_item.html"),
+        headers={"Content-Type": "text/html; charset=utf-8"},
+    )
+
+    result = await _parse("https://m.aliexpress.ru/item/1005006123456789.html?spm=a2g2w.home&sku_id=1200")
+
+    assert result.title == "Беспроводная мышь M330, бесшумная, 2.4 ГГц"
+    assert result.image_url == "https://ae04.alicdn.com/kf/S3f2a9c1b7e4d4a6c9b1f0e2d3c4b5a6fQ.jpg"
+    assert result.price == 1250
+    assert result.price_source == "text"
+
+
+async def test_lamoda(upstream):
+    upstream.add(
+        "/www.lamoda.ru/p/mp002xw0v5ny/clothes-mango-plate/",
+        _fixture("lamoda_product.html"),
+        headers={"Content-Type": "text/html; charset=utf-8"},
+    )
+
+    result = await _parse("https://www.lamoda.ru/p/MP002XW0V5NY/clothes-mango-plate/?utm_source=x")
+
+    assert result.title == "Платье Mango"
+    assert result.image_url == "https://a.lmcdn.ru/img600x866/M/P/MP002XW0V5NY_21836451_1_v1.jpg"
+    assert result.price == 3999
+    assert result.price_source == "json-ld"
+
+
+async def test_lamoda_falls_back_to_slug_when_page_fails(upstream):
+    upstream.add("/www.lamoda.ru/p/mp002xw0v5ny/clothes-mango-plate/", status=403)
+
+    result = await _parse("https://www.lamoda.ru/p/MP002XW0V5NY/clothes-mango-plate/")
+
+    assert result.title == "Mango plate"
+    assert result.price is None
+    assert result.image_url is None
+
+
+@pytest.mark.parametrize(
+    ("host", "adapter"),
+    [
+        ("wildberries.ru", "wildberries"),
+        ("www.wildberries.ru", "wildberries"),
+        ("global.wildberries.ru", "wildberries"),
+        ("wb.ru", "wildberries"),
+        ("WWW.OZON.RU.", "ozon"),
+        ("m.ozon.ru", "ozon"),
+        ("market.yandex.ru", "yandex_market"),
+        ("m.market.yandex.ru", "yandex_market"),
+        ("de.aliexpress.com", "aliexpress"),
+        ("aliexpress.ru", "aliexpress"),
+        ("www.lamoda.ru", "lamoda"),
+        ("notozon.ru", None),
+        ("evil-ozon.ru", None),
+        ("ozon.ru.evil.com", None),
+        ("ozon.com", None),
+        ("yandex.ru", None),
+        ("market.yandex.com", None),
+        ("wildberries.ru.example.org", None),
+        ("ru", None),
+        ("", None),
+    ],
+)
+def test_registry_matches_on_label_boundaries(host, adapter):
+    found = registry.find(host)
+
+    assert (found.name if found else None) == adapter
+
+
+def test_registry_deepest_suffix_wins():
+    class Shop(MarketplaceAdapter):
+        name = "shop"
+        domains = ("example.ru",)
+
+    class Outlet(MarketplaceAdapter):
+        name = "outlet"
+        domains = ("outlet.example.ru",)
+
+    adapters = AdapterRegistry()
+    adapters.register(Shop())
+    adapters.register(Outlet())
+
+    assert adapters.find("www.example.ru").name == "shop"
+    assert adapters.find("outlet.example.ru").name == "outlet"
+    assert adapters.find("m.outlet.example.ru").name == "outlet"
+    assert adapters.find("example.ru").name == "shop"
+    assert adapters.find("outletexample.ru") is None
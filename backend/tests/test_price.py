@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from app.utils.html_meta import HeadMeta, extract_head_meta
+from app.utils.price import extract_price, find_price, parse_amount
+
+PAGES = sorted((Path(__file__).parent / "fixtures" / "pages").glob("*.html"))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (12990, 12990),
+        (1990.5, 1990),
+        ("12990", 12990),
+        ("12 990", 12990),
+        ("12\xa0990", 12990),
+        ("12 990 ₽", 12990),
+        ("1 990,00", 1990),
+        ("1,990", 1990),
+        ("1.990", 1990),
+        ("1.234.567", 1234567),
+        ("1,990.50", 1990),
+        ("1.990,50", 1990),
+        ("12.99", 13),
+        ("12,9", 13),
+        ("0.990", 1),
+        ("от 1 990 рублей", 1990),
+        ("12.05.2024", None),
+        ("0", None),
+        ("100000000", None),
+        ("", None),
+        ("бесплатно", None),
+        (True, None),
+        (None, None),
+    ],
+)
+def test_parse_amount(value, expected):
+    assert parse_amount(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Цена: 1 990 ₽", 1990),
+        ("Цена: 1.990 руб.", 1990),
+        ("Цена: 1 990,00 ₽", 1990),
+        ("Доставка 0 ₽, товар 2 490 ₽", 2490),
+        ("Скидка 5, 1 990 ₽", 1990),
+        ("нет цены", None),
+    ],
+)
+def test_extract_price(text, expected):
+    assert extract_price(text) == expected
+
+
+def _head(json_ld=(), meta=None) -> HeadMeta:
+    return HeadMeta(meta or {}, None, list(json_ld))
+
+
+def test_json_ld_offer_wins_over_text():
+    product = {"@type": "Product", "offers": {"@type": "Offer", "price": "4990", "priceCurrency": "RUB"}}
+
+    price = find_price("от 416 ₽/мес", _head([product]))
+
+    assert (price.amount, price.source) == (4990, "json-ld")
+
+
+def test_json_ld_skips_foreign_currency_and_reads_aggregate_offer():
+    product = {
+        "@type": ["Product", "IndividualProduct"],
+        "offers": [
+            {"@type": "Offer", "price": "59.99", "priceCurrency": "USD"},
+            {"@type": "AggregateOffer", "lowPrice": "5,490", "priceCurrency": "RUB"},
+        ],
+    }
+
+    assert find_price("", _head([product])).amount == 5490
+
+
+def test_json_ld_in_body_is_used():
+    html = (
+        "<html><head></head><body>"
+        '<script type="application/ld+json">{"@type": "Product", "offers": {"price": 890}}</script>'
+        "</body></html>"
+    )
+
+    assert find_price(html, extract_head_meta(html)) == (890, "json-ld")
+
+
+def test_meta_price_in_other_currency_is_ignored():
+    head = _head(meta={"product:price:amount": "19.99", "product:price:currency": "EUR"})
+
+    assert find_price("", head) is None
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda page: page.stem)
+def test_fixture_page_price(page):
+    html = page.read_text(encoding="utf-8")
+    expected = int(page.with_suffix(".price").read_text())
+
+    price = find_price(html, extract_head_meta(html))
+
+    assert price is not None
+    assert price.amount == expected
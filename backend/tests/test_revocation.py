@@ -0,0 +1,61 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from app.core.database import utcnow
+from app.core.revocation import RevocationList
+from app.core.security import decode_access_token
+from app.utils.bloom import BloomFilter
+
+
+def test_bloom_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    added = [uuid.uuid4().hex for _ in range(1000)]
+    for item in added:
+        bloom.add(item)
+
+    assert all(item in bloom for item in added)
+
+
+def test_bloom_false_positive_rate_is_near_target():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for _ in range(1000):
+        bloom.add(uuid.uuid4().hex)
+
+    false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10_000))
+
+    assert false_positives < 300  # 1% expected, 3% allowed
+
+
+def test_revocation_list_lookup():
+    revocations = RevocationList(capacity=100)
+    revocations.add("revoked-jti", utcnow() + timedelta(hours=1))
+
+    assert revocations.is_revoked("revoked-jti")
+    assert not revocations.is_revoked("other-jti")
+    assert not revocations.is_revoked(None)
+    assert len(revocations) == 1
+
+
+async def _login(api, email: str) -> str:
+    response = await api.post("/auth/login", json={"email": email, "password": "password123"})
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+@pytest.mark.anyio
+async def test_sync_picks_up_logouts_from_other_workers(api):
+    email = f"u{uuid.uuid4().hex[:12]}@example.com"
+    response = await api.post("/auth/register", json={"email": email, "password": "password123", "name": "Tester"})
+    first = response.json()["access_token"]
+    second = await _login(api, email)
+    mirror = RevocationList()  # another worker's copy
+
+    await api.post("/auth/logout", headers={"Authorization": f"Bearer {first}"})
+    await mirror.sync()  # full load
+    await api.post("/auth/logout", headers={"Authorization": f"Bearer {second}"})
+    await mirror.sync()  # incremental
+
+    assert mirror.is_revoked(decode_access_token(first)["jti"])
+    assert mirror.is_revoked(decode_access_token(second)["jti"])
@@ -0,0 +1,91 @@
+import pytest
+
+from app.api.endpoints import upload
+
+pytestmark = pytest.mark.anyio
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 1024
+BOUNDARY = "upload-test"
+CHUNK = 64 * 1024
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "UPLOAD_DIR", tmp_path)
+    return tmp_path
+
+
+def _part_head(content_type: str = "image/png") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="photo.png"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+
+
+def _multipart_headers(auth_headers) -> dict[str, str]:
+    return {**auth_headers, "Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+async def test_upload_is_stored_and_served(api, auth_headers, upload_dir):
+    response = await api.post("/upload", files={"file": ("photo.png", PNG, "image/png")}, headers=auth_headers)
+
+    assert response.status_code == 200, response.text
+    filename = response.json()["url"].rsplit("/", 1)[1]
+    assert [path.name for path in upload_dir.iterdir()] == [filename]
+    served = await api.get(f"/uploads/{filename}")
+    assert served.content == PNG
+    assert served.headers["content-type"] == "image/png"
+
+
+async def test_spoofed_content_type_is_rejected(api, auth_headers, upload_dir):
+    page = b"<html><script>alert(1)</script></html>"
+
+    response = await api.post("/upload", files={"file": ("photo.png", page, "image/png")}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert list(upload_dir.iterdir()) == []
+
+
+async def test_oversized_chunked_body_is_cut_off_early(api, auth_headers, upload_dir):
+    sent = 0
+
+    async def body():
+        nonlocal sent
+        yield _part_head()
+        yield PNG
+        for _ in range(4 * upload._MAX_BODY // CHUNK):
+            sent += CHUNK
+            yield b"\0" * CHUNK
+
+    # An async generator goes out chunked, without Content-Length
+    response = await api.post("/upload", content=body(), headers=_multipart_headers(auth_headers))
+
+    assert response.status_code == 413
+    assert sent <= upload._MAX_BODY + CHUNK
+    assert list(upload_dir.iterdir()) == []
+
+
+async def test_aborted_upload_leaves_no_temp_file(api, auth_headers, upload_dir):
+    class Aborted(Exception):
+        pass
+
+    async def body():
+        yield _part_head()
+        yield PNG
+        yield b"\0" * CHUNK
+        raise Aborted
+
+    with pytest.raises(Aborted):
+        await api.post("/upload", content=body(), headers=_multipart_headers(auth_headers))
+
+    assert list(upload_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("name", [".env", ".0f9c2a.part"])
+async def test_get_upload_refuses_dotfiles(api, upload_dir, name):
+    (upload_dir / name).write_bytes(PNG)
+
+    response = await api.get(f"/uploads/{name}")
+
+    assert response.status_code == 400
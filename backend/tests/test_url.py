@@ -0,0 +1,39 @@
+from urllib.parse import urlsplit
+
+import pytest
+
+from app.utils.url import canonicalize_url, strip_params
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("HTTPS://WWW.Ozon.RU/product/123/", "https://www.ozon.ru/product/123/"),
+        ("https://shop.ru:443/item?b=2&a=1", "https://shop.ru/item?a=1&b=2"),
+        ("http://shop.ru:8080/item", "http://shop.ru:8080/item"),
+        ("https://shop.ru", "https://shop.ru/"),
+        ("https://shop.ru/item?utm_source=tg&gclid=x&id=5#reviews", "https://shop.ru/item?id=5"),
+        # Site-specific names mean something elsewhere: only adapters drop them
+        ("https://shop.ru/item?ref=home&from=7&sh=1", "https://shop.ru/item?from=7&ref=home&sh=1"),
+        # Blank and valueless params are kept as written
+        ("https://shop.ru/item?1234", "https://shop.ru/item?1234"),
+        ("https://shop.ru/item?b=&a", "https://shop.ru/item?a&b="),
+        ("https://shop.ru/item?q=a%20b&UTM_Medium=x", "https://shop.ru/item?q=a%20b"),
+        ("http://[2001:DB8::1]/item", "http://[2001:db8::1]/item"),
+        ("http://[2001:db8::1]:8080/item", "http://[2001:db8::1]:8080/item"),
+        ("https://[2001:db8::1]:443/item", "https://[2001:db8::1]/item"),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonical_ipv6_url_parses_back():
+    parts = urlsplit(canonicalize_url("http://[::ffff:5db8:d822]:8080/p"))
+    assert parts.hostname == "::ffff:5db8:d822"
+    assert parts.port == 8080
+
+
+def test_strip_params_leaves_the_rest_untouched():
+    url = "https://www.ozon.ru/product/x-1/?Asb=abc&1234&utm_source=tg&q=a+b#top"
+    assert strip_params(url, {"asb"}) == "https://www.ozon.ru/product/x-1/?1234&utm_source=tg&q=a+b#top"
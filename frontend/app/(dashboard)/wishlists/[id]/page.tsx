@@ -31,7 +31,7 @@ import {
   useUpdateItem,
   useDeleteItem,
   useRestoreItem,
-  useReorderItems,
+  useMoveItem,
 } from "@/hooks/useItems";
 
 export default function WishlistEditPage() {
@@ -45,7 +45,7 @@ export default function WishlistEditPage() {
   const updateItem = useUpdateItem(id);
   const deleteItem = useDeleteItem(id);
   const restoreItem = useRestoreItem(id);
-  const reorderItems = useReorderItems(id);
+  const moveItem = useMoveItem(id);
 
   const [addFormOpen, setAddFormOpen] = useState(false);
   const [editingItem, setEditingItem] = useState<string | null>(null);
@@ -71,12 +71,14 @@ export default function WishlistEditPage() {
     const newIndex = items.findIndex((i) => i.id === over.id);
     if (oldIndex === -1 || newIndex === -1) return;
 
+    // Send only the new neighbours: the server rewrites just this item
     const reordered = arrayMove(items, oldIndex, newIndex);
-    const reorderData = reordered.map((item, index) => ({
-      id: item.id,
-      position: index + 1,
-    }));
-    reorderItems.mutate(reorderData);
+    moveItem.mutate({
+      id: String(active.id),
+      prevId: reordered[newIndex - 1]?.id ?? null,
+      nextId: reordered[newIndex + 1]?.id ?? null,
+      order: reordered.map((item) => item.id),
+    });
   };
 
   const handleDeleteItem = (itemId: string) => {
@@ -83,6 +83,8 @@ export function useLogout() {
   const logout = useAuthStore((s) => s.logout);
 
   return () => {
+    // Revoke the token server-side; local logout must not wait for it
+    apiClient.post("/auth/logout").catch(() => {});
     logout();
     router.push("/login");
   };
@@ -148,3 +148,48 @@ export function useReorderItems(wishlistId: string) {
     },
   });
 }
+
+interface MoveItemData {
+  id: string;
+  prevId: string | null;
+  nextId: string | null;
+  // Full new order, used only for the optimistic update
+  order: string[];
+}
+
+export function useMoveItem(wishlistId: string) {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: async ({ id, prevId, nextId }: MoveItemData) => {
+      await apiClient.patch(`/items/${id}/move`, {
+        prev_id: prevId,
+        next_id: nextId,
+      });
+    },
+    onMutate: async ({ order }) => {
+      await queryClient.cancelQueries({ queryKey: ["items", wishlistId] });
+      const previous = queryClient.getQueryData<PaginatedResponse<WishlistItem>>(
+        ["items", wishlistId, 1]
+      );
+      if (previous) {
+        const sorted = [...previous.items].sort(
+          (a, b) => order.indexOf(a.id) - order.indexOf(b.id)
+        );
+        queryClient.setQueryData(["items", wishlistId, 1], {
+          ...previous,
+          items: sorted,
+        });
+      }
+      return { previous };
+    },
+    onError: (_err, _vars, context) => {
+      if (context?.previous) {
+        queryClient.setQueryData(["items", wishlistId, 1], context.previous);
+      }
+    },
+    onSettled: () => {
+      queryClient.invalidateQueries({ queryKey: ["items", wishlistId] });
+    },
+  });
+}
@@ -6,6 +6,8 @@ interface ParsedUrl {
   image_url: string | null;
   description: string | null;
   price: number | null;
+  price_source: "marketplace" | "json-ld" | "meta" | "microdata" | "text" | null;
+  price_confidence: number | null;
 }
 
 export function useParseUrl() {
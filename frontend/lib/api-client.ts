@@ -2,6 +2,12 @@ import axios from "axios";
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
+// After a mutation, route reads to the primary DB for a short window so the
+// UI never sees a lagging replica (read-your-writes).
+const READ_PRIMARY_HEADER = "X-Read-Primary";
+const READ_PRIMARY_WINDOW_MS = 5000;
+let readPrimaryUntil = 0;
+
 const apiClient = axios.create({
   baseURL: `${API_URL}/api`,
   headers: {
@@ -24,12 +30,20 @@ apiClient.interceptors.request.use((config) => {
       }
     }
   }
+  if (config.method === "get" && Date.now() < readPrimaryUntil) {
+    config.headers[READ_PRIMARY_HEADER] = "1";
+  }
   return config;
 });
 
 // Response interceptor: handle 401 (skip auth endpoints and public pages)
 apiClient.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    if (response.config.method && response.config.method !== "get") {
+      readPrimaryUntil = Date.now() + READ_PRIMARY_WINDOW_MS;
+    }
+    return response;
+  },
   (error) => {
     if (error.response?.status === 401 && typeof window !== "undefined") {
       const url = error.config?.url || "";
@@ -4,11 +4,14 @@ export type WsMessageType =
   | "contribution_added"
   | "contribution_removed"
   | "item_added"
+  | "items_added"
   | "item_updated"
   | "item_deleted"
+  | "items_deleted"
   | "wishlist_deleted";
 
 export interface WsMessage {
   type: WsMessageType;
   item_id?: string;
+  item_ids?: string[];
 }